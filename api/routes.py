@@ -1,10 +1,15 @@
-from fastapi import APIRouter, HTTPException, Request, BackgroundTasks
-from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
-import json
+from fastapi import APIRouter, Depends, HTTPException, Request, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi.requests import HTTPConnection
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import itertools
+import orjson
 import logging
-from datetime import datetime
 import asyncio
+import os
 
 # Import our services
 from utils.process_monitor import (
@@ -14,196 +19,257 @@ from utils.process_monitor import (
     SystemInfoService,
     DesktopClientService,
     load_config, 
-    save_config
+    save_config,
+    get_unix_socket_path,
+    SESSION_HISTORY_MAX,
+    DESKTOP_QUEUE_MAX
 )
+from utils.clock import now_iso
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Success paths log one request in LOG_SAMPLE_RATE; errors are always logged
+LOG_SAMPLE_RATE = 10
 
-# Global service instances (will be injected from main app)
-monitor_service: Optional[ProcessMonitorService] = None
-session_manager: Optional[SessionManager] = None  
-notification_service: Optional[NotificationService] = None
-system_info_service: Optional[SystemInfoService] = None
-
-desktop_service: Optional[DesktopClientService] = None
-
-# Initialize services on module load
-def init_services():
-    global monitor_service, session_manager, notification_service, system_info_service, desktop_service
+class _LogSampler:
+    """Lets through one call in every `rate`"""
+    
+    def __init__(self, rate: int):
+        self.rate = rate
+        self._counter = itertools.count()
+    
+    def should_log(self) -> bool:
+        return next(self._counter) % self.rate == 0
+
+_sampler = _LogSampler(LOG_SAMPLE_RATE)
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Static part of the /health payload, built once
+_HEALTH_BASE = {
+    "status": "healthy",
+    "version": "1.0.0"
+}
+
+class Services(NamedTuple):
+    """Linked service instances shared by every endpoint"""
+    monitor: ProcessMonitorService
+    session_manager: SessionManager
+    notification: NotificationService
+    system_info: SystemInfoService
+    desktop: DesktopClientService
+    io_pool: ThreadPoolExecutor  # blocking psutil work, kept off the loop and the anyio pool
+
+def create_services() -> Services:
+    """Create and link the services; called once from the app lifespan"""
     monitor_service = ProcessMonitorService()
-    session_manager = SessionManager()
-    notification_service = NotificationService()
+    config = load_config()
+    history_max = config.get("history_max", SESSION_HISTORY_MAX)
+    session_manager = SessionManager(history_max)
+    notification_service = NotificationService(history_max)
     system_info_service = SystemInfoService()
-    desktop_service = DesktopClientService()
+    desktop_service = DesktopClientService(
+        config.get("desktop_client", {}).get("queue_max_items", DESKTOP_QUEUE_MAX)
+    )
     
     # Link services
     monitor_service.set_session_manager(session_manager)
+    monitor_service.set_desktop_service(desktop_service)
     session_manager.set_desktop_service(desktop_service)
+    
+    return Services(
+        monitor=monitor_service,
+        session_manager=session_manager,
+        notification=notification_service,
+        system_info=system_info_service,
+        desktop=desktop_service,
+        io_pool=ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="psutil")
+    )
+
+async def run_blocking(svc: Services, func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking psutil call on the dedicated pool"""
+    return await asyncio.get_running_loop().run_in_executor(svc.io_pool, func, *args)
+
+async def get_services(connection: HTTPConnection) -> Services:
+    """Dependency returning the services stored on app.state by the lifespan"""
+    return connection.app.state.services
 
 # Pydantic models for request validation
-class MonitorStartRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: validated once on the way in, never mutated"""
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
+class MonitorStartRequest(RequestModel):
     child_profile: str
     timestamp: Optional[str] = None
 
-class MonitorStopRequest(BaseModel):
+class MonitorStopRequest(RequestModel):
     child_profile: str
     timestamp: Optional[str] = None
 
-class ForceCloseRequest(BaseModel):
+class ForceCloseRequest(RequestModel):
     child_profile: str
     reason: Optional[str] = "Parent control - session ended"
 
-class NotificationRequest(BaseModel):
+class NotificationRequest(RequestModel):
     title: str
     message: str
     timestamp: Optional[str] = None
 
-class TimeLimitRequest(BaseModel):
+class TimeLimitRequest(RequestModel):
     child_profile: str
     limit_minutes: int
     enforce_immediately: Optional[bool] = True
 
-class SyncFirebaseRequest(BaseModel):
-    session_data: Dict[str, Any]
+# Browser/HTTP cache policy for status payloads that change every few seconds at most
+STATUS_CACHE_CONTROL = "max-age=2, stale-while-revalidate=5"
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag for an encoded response body"""
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when the client's If-None-Match already names this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and etag in (tag.strip() for tag in if_none_match.split(","))
+
+def cached_json_response(request: Request, payload: Dict[str, Any]) -> Response:
+    """Encode payload with an ETag, answering 304 when the client already has it"""
+    body = orjson.dumps(payload)
+    etag = compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": STATUS_CACHE_CONTROL}
+    
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+_END_OF_RECORDS = object()
+
+def _stream_ndjson(svc: Services, records: Iterator[Dict[str, Any]], what: str) -> StreamingResponse:
+    """Stream an iterator of dicts as newline-delimited JSON.
+
+    Each record is pulled on the dedicated psutil pool, so a lazy scan
+    behind the iterator never blocks the event loop. The body is sent
+    after the handler returns, so a failing scan is logged here and ends
+    the stream at the last complete line.
+    """
+    async def generate():
+        try:
+            while True:
+                record = await run_blocking(svc, next, records, _END_OF_RECORDS)
+                if record is _END_OF_RECORDS:
+                    return
+                yield orjson.dumps(record) + b"\n"
+        except Exception as e:
+            logger.error("Error streaming %s: %s", what, e)
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 # Health and Status Endpoints
 @router.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    }
+    return {**_HEALTH_BASE, "timestamp": now_iso()}
 
 @router.get("/roblox/status")
-async def get_roblox_status():
+async def get_roblox_status(request: Request, svc: Services = Depends(get_services)):
     """Get current Roblox process status"""
-    if not monitor_service:
-        init_services()
-    
     try:
-        status = monitor_service.get_roblox_status()
-        return status
+        status = await run_blocking(svc, svc.monitor.get_roblox_status)
+        return cached_json_response(request, status)
     except Exception as e:
-        logger.error(f"Error getting Roblox status: {e}")
+        logger.error("Error getting Roblox status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/roblox/process")
-async def get_roblox_process_info():
-    """Get detailed Roblox process information"""
-    if not monitor_service:
-        init_services()
-    
-    try:
-        info = monitor_service.get_process_info()
-        return info
-    except Exception as e:
-        logger.error(f"Error getting process info: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_roblox_process_info(svc: Services = Depends(get_services)):
+    """Get detailed Roblox process information, one NDJSON line per process"""
+    return _stream_ndjson(svc, svc.monitor.iter_process_info(), "process info")
 
 # Monitoring Control Endpoints
 @router.post("/monitor/start")
-async def start_monitoring(request: MonitorStartRequest):
+async def start_monitoring(request: MonitorStartRequest, svc: Services = Depends(get_services)):
     """Start monitoring a child's Roblox activity"""
-    if not monitor_service or not session_manager:
-        init_services()
-    
     try:
         # Start monitoring service if not already running
-        if not monitor_service.is_running():
-            await monitor_service.start()
+        if not svc.monitor.is_running():
+            await svc.monitor.start()
         
         # Start session for the child
-        session = await session_manager.start_session(request.child_profile)
+        session = await svc.session_manager.start_session(request.child_profile)
         
-        logger.info(f"Started monitoring for child profile: {request.child_profile}")
+        if logger.isEnabledFor(logging.INFO) and _sampler.should_log():
+            logger.info("Started monitoring for child profile: %s", request.child_profile)
         
         return {
             "status": "success",
             "message": f"Monitoring started for {request.child_profile}",
             "session_id": session.session_id,
             "child_profile": request.child_profile,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Error starting monitoring: {e}")
+        logger.error("Error starting monitoring: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/monitor/stop") 
-async def stop_monitoring(request: MonitorStopRequest):
+async def stop_monitoring(request: MonitorStopRequest, svc: Services = Depends(get_services)):
     """Stop monitoring a child's Roblox activity"""
-    if not session_manager:
-        init_services()
-    
     try:
-        # End session for the child
-        session = await session_manager.end_session(request.child_profile)
+        # End session for the child (this also queues the Firebase sync
+        # request for the desktop client)
+        session = await svc.session_manager.end_session(request.child_profile)
         
-        if session:
-            # Sync to Firebase if available
-            if firebase_service and firebase_service.firebase_initialized:
-                await firebase_service.sync_session(session.to_dict())
-        
-        logger.info(f"Stopped monitoring for child profile: {request.child_profile}")
+        if logger.isEnabledFor(logging.INFO) and _sampler.should_log():
+            logger.info("Stopped monitoring for child profile: %s", request.child_profile)
         
         return {
             "status": "success", 
             "message": f"Monitoring stopped for {request.child_profile}",
             "session_data": session.to_dict() if session else None,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Error stopping monitoring: {e}")
+        logger.error("Error stopping monitoring: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Roblox Control Endpoints
 @router.post("/roblox/close")
-async def force_close_roblox(request: ForceCloseRequest):
+async def force_close_roblox(request: ForceCloseRequest, svc: Services = Depends(get_services)):
     """Force close Roblox application"""
-    if not monitor_service:
-        init_services()
-    
     try:
-        success = await monitor_service.force_close_roblox(request.reason)
+        success = await svc.monitor.force_close_roblox(request.reason)
         
         if success:
             # Also end any active sessions
-            if session_manager:
-                await session_manager.end_session(request.child_profile)
+            await svc.session_manager.end_session(request.child_profile)
             
             # Send notification
-            if notification_service:
-                await notification_service.send_desktop_notification(
-                    "Roblox Closed",
-                    f"Roblox has been closed for {request.child_profile}: {request.reason}"
-                )
+            await svc.notification.send_desktop_notification(
+                "Roblox Closed",
+                f"Roblox has been closed for {request.child_profile}: {request.reason}"
+            )
         
         return {
             "status": "success" if success else "error",
             "message": "Roblox closed successfully" if success else "Failed to close Roblox",
             "child_profile": request.child_profile,
             "reason": request.reason,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Error closing Roblox: {e}")
+        logger.error("Error closing Roblox: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Session Management Endpoints  
 @router.get("/session/live/{child_profile}")
-async def get_live_session(child_profile: str):
+async def get_live_session(child_profile: str, svc: Services = Depends(get_services)):
     """Get live session data for a child profile"""
-    if not session_manager:
-        init_services()
-    
     try:
-        session_data = session_manager.get_live_session(child_profile)
+        session_data = svc.session_manager.get_live_session(child_profile)
         
         if session_data:
             return session_data
@@ -216,89 +282,90 @@ async def get_live_session(child_profile: str):
             }
             
     except Exception as e:
-        logger.error(f"Error getting live session: {e}")
+        logger.error("Error getting live session: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Firebase Sync Endpoints
 @router.post("/sync/firebase")
-async def sync_session_with_firebase(request: SyncFirebaseRequest):
+async def sync_session_with_firebase(request: Request, svc: Services = Depends(get_services)):
     """Sync session data with Firebase via desktop client"""
-    if not desktop_service:
-        init_services()
+    # session_data is passed through untouched, so the body is decoded
+    # directly rather than copied through a pydantic model
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON")
+    if not isinstance(body, dict) or body.keys() != {"session_data"} or not isinstance(body["session_data"], dict):
+        raise HTTPException(status_code=422, detail="Expected a JSON object with a single 'session_data' object")
     
     try:
         # Send to desktop client for Firebase sync
-        success = await desktop_service.request_firebase_sync(request.session_data, "manual_sync")
+        success = await svc.desktop.request_firebase_sync(body["session_data"], "manual_sync")
         
         return {
             "status": "success" if success else "error", 
             "message": "Sync request sent to desktop client" if success else "Desktop client not available",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "note": "Firebase sync handled by desktop client for security"
         }
             
     except Exception as e:
-        logger.error(f"Error requesting Firebase sync: {e}")
+        logger.error("Error requesting Firebase sync: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/sync/confirm")
 async def confirm_firebase_sync(request: Request):
     """Confirm Firebase sync completion from desktop client"""
     try:
-        data = await request.json()
+        data = orjson.loads(await request.body())
         session_id = data.get("session_id")
         success = data.get("success", False)
         
-        logger.info(f"Firebase sync {'successful' if success else 'failed'} for session: {session_id}")
+        if not success:
+            logger.warning("Firebase sync failed for session: %s", session_id)
+        elif logger.isEnabledFor(logging.INFO) and _sampler.should_log():
+            logger.info("Firebase sync successful for session: %s", session_id)
         
         return {
             "status": "success",
             "message": "Sync confirmation received",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
-        logger.error(f"Error processing sync confirmation: {e}")
+        logger.error("Error processing sync confirmation: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # System Information Endpoints
 @router.get("/system/info")
-async def get_system_info():
+def get_system_info(request: Request, svc: Services = Depends(get_services)):
     """Get system information"""
-    if not system_info_service:
-        init_services()
-    
     try:
-        info = system_info_service.get_system_info()
-        return info
+        info = svc.system_info.get_system_info()
+        return cached_json_response(request, info)
     except Exception as e:
-        logger.error(f"Error getting system info: {e}")
+        logger.error("Error getting system info: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Time Limits and Parental Controls
 @router.post("/limits/set")
-async def set_system_time_limit(request: TimeLimitRequest):
+async def set_system_time_limit(request: TimeLimitRequest, svc: Services = Depends(get_services)):
     """Configure time limits on the system level"""
-    if not session_manager:
-        init_services()
-    
     try:
         # Set time limit
-        session_manager.set_time_limit(request.child_profile, request.limit_minutes)
+        svc.session_manager.set_time_limit(request.child_profile, request.limit_minutes)
         
         # Check if we need to enforce immediately
         if request.enforce_immediately:
-            exceeded_profiles = session_manager.check_time_limits()
+            exceeded_profiles = svc.session_manager.check_time_limits()
             if request.child_profile in exceeded_profiles:
                 # Force close Roblox
-                if monitor_service:
-                    await monitor_service.force_close_roblox("Time limit exceeded")
+                await svc.monitor.force_close_roblox("Time limit exceeded")
                 
                 # Send notification
-                if notification_service:
-                    await notification_service.send_desktop_notification(
-                        "Time Limit Reached",
-                        f"Time limit of {request.limit_minutes} minutes reached for {request.child_profile}"
-                    )
+                await svc.notification.send_desktop_notification(
+                    "Time Limit Reached",
+                    f"Time limit of {request.limit_minutes} minutes reached for {request.child_profile}"
+                )
         
         return {
             "status": "success",
@@ -306,22 +373,19 @@ async def set_system_time_limit(request: TimeLimitRequest):
             "child_profile": request.child_profile,
             "limit_minutes": request.limit_minutes,
             "enforced_immediately": request.enforce_immediately,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Error setting time limit: {e}")
+        logger.error("Error setting time limit: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Notification Endpoints
 @router.post("/notification/send")
-async def send_desktop_notification(request: NotificationRequest):
+async def send_desktop_notification(request: NotificationRequest, svc: Services = Depends(get_services)):
     """Send notification to desktop system"""
-    if not notification_service:
-        init_services()
-    
     try:
-        success = await notification_service.send_desktop_notification(
+        success = await svc.notification.send_desktop_notification(
             request.title, 
             request.message
         )
@@ -331,11 +395,11 @@ async def send_desktop_notification(request: NotificationRequest):
             "message": "Notification sent successfully" if success else "Failed to send notification",
             "title": request.title,
             "content": request.message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Error sending notification: {e}")
+        logger.error("Error sending notification: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Legacy endpoints for backward compatibility
@@ -343,239 +407,257 @@ async def send_desktop_notification(request: NotificationRequest):
 async def load_config_endpoint(request: Request):
     """Load config as JSON data from POST request body"""
     try:
-        data = await request.json()
+        data = orjson.loads(await request.body())
         save_config(data)
         
         return {
             "status": "success",
             "message": "Config loaded successfully",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
-        logger.error(f"Error loading config: {e}")
+        logger.error("Error loading config: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/processes")
-def get_current_processes():
-    """Get the current Roblox processes"""
-    if not monitor_service:
-        init_services()
-    
-    try:
-        status = monitor_service.get_roblox_status()
-        return {"processes": status.get("processes", [])}
-    except Exception as e:
-        logger.error(f"Error getting processes: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_current_processes(svc: Services = Depends(get_services)):
+    """Get the current Roblox processes, one NDJSON line per process"""
+    return _stream_ndjson(svc, svc.monitor.iter_process_info(), "processes")
 
 @router.post("/monitor")
-async def start_monitoring_legacy(background_tasks: BackgroundTasks):
+async def start_monitoring_legacy(background_tasks: BackgroundTasks, svc: Services = Depends(get_services)):
     """Legacy endpoint to start monitoring"""
-    if not monitor_service:
-        init_services()
-    
     try:
-        if not monitor_service.is_running():
-            await monitor_service.start()
+        if not svc.monitor.is_running():
+            await svc.monitor.start()
             
         return {
             "status": "success",
             "message": "Monitoring started",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
-        logger.error(f"Error starting monitoring: {e}")
+        logger.error("Error starting monitoring: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/kill_roblox")
-async def kill_roblox_legacy():
+async def kill_roblox_legacy(svc: Services = Depends(get_services)):
     """Legacy endpoint to kill Roblox processes"""
-    if not monitor_service:
-        init_services()
-    
     try:
-        await monitor_service.force_close_roblox("Manual termination")
+        await svc.monitor.force_close_roblox("Manual termination")
         return {
             "status": "success", 
             "message": "Roblox processes terminated",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
-        logger.error(f"Error killing Roblox: {e}")
+        logger.error("Error killing Roblox: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-# Initialize services when module loads
-init_services()
-
 # Desktop Client Communication Endpoints
 @router.post("/desktop/connect")
-async def desktop_client_connect():
+async def desktop_client_connect(svc: Services = Depends(get_services)):
     """Notify Python backend that desktop client is connected"""
-    if not desktop_service:
-        init_services()
-    
     try:
-        desktop_service.set_client_connected(True)
+        svc.desktop.set_client_connected(True)
         return {
             "status": "success",
             "message": "Desktop client connected successfully",
-            "websocket_available": desktop_service.websocket_server is not None,
-            "websocket_url": "ws://localhost:8001" if desktop_service.websocket_server else None,
+            "websocket_available": svc.desktop.websocket_server is not None,
+            "websocket_url": "ws://localhost:8001" if svc.desktop.websocket_server else None,
+            "unix_socket": get_unix_socket_path(svc.monitor.config),
             "queued_items": {
-                "sessions": len(desktop_service.session_data_queue),
-                "notifications": len(desktop_service.notification_queue),
-                "events": len(desktop_service.event_queue)
+                "sessions": len(svc.desktop.session_data_queue),
+                "notifications": len(svc.desktop.notification_queue),
+                "events": len(svc.desktop.event_queue)
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
-        logger.error(f"Error connecting desktop client: {e}")
+        logger.error("Error connecting desktop client: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/desktop/disconnect") 
-async def desktop_client_disconnect():
+async def desktop_client_disconnect(svc: Services = Depends(get_services)):
     """Notify Python backend that desktop client is disconnected"""
-    if not desktop_service:
-        init_services()
-    
     try:
-        desktop_service.set_client_connected(False)
+        svc.desktop.set_client_connected(False)
         return {
             "status": "success",
             "message": "Desktop client disconnected",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
-        logger.error(f"Error disconnecting desktop client: {e}")
+        logger.error("Error disconnecting desktop client: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/desktop/status")
-async def get_desktop_client_status():
+async def get_desktop_client_status(svc: Services = Depends(get_services)):
     """Get desktop client connection status"""
-    if not desktop_service:
-        init_services()
-    
     return {
-        "connected": desktop_service.desktop_client_connected,
-        "websocket_available": desktop_service.websocket_server is not None,
-        "websocket_clients": desktop_service.websocket_server.has_connected_clients() if desktop_service.websocket_server else False,
-        "queued_sessions": len(desktop_service.session_data_queue),
-        "queued_notifications": len(desktop_service.notification_queue),
-        "queued_events": len(desktop_service.event_queue),
-        "timestamp": datetime.now().isoformat()
+        "connected": svc.desktop.desktop_client_connected,
+        "websocket_available": svc.desktop.websocket_server is not None,
+        "websocket_clients": svc.desktop.websocket_server.has_connected_clients() if svc.desktop.websocket_server else False,
+        "queued_sessions": len(svc.desktop.session_data_queue),
+        "queued_notifications": len(svc.desktop.notification_queue),
+        "queued_events": len(svc.desktop.event_queue),
+        "timestamp": now_iso()
     }
 
 # HTTP Polling endpoints for desktop client
 @router.get("/desktop/events/poll")
-async def poll_events():
+async def poll_events(svc: Services = Depends(get_services)):
     """Poll for pending events (HTTP fallback when WebSocket not available)"""
-    if not desktop_service:
-        init_services()
-    
     try:
-        events = desktop_service.get_pending_events()
+        events = svc.desktop.get_pending_events()
         return {
             "status": "success",
             "events": events,
             "count": len(events),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
-        logger.error(f"Error polling events: {e}")
+        logger.error("Error polling events: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _until_disconnect(websocket: WebSocket):
+    """Return once the client closes the socket"""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+@router.websocket("/desktop/ws")
+async def desktop_events_ws(websocket: WebSocket, svc: Services = Depends(get_services)):
+    """Push queued events to the desktop client as they arrive (replaces polling)"""
+    await websocket.accept()
+    # Watch for the client going away while parked waiting for events
+    receiver = asyncio.create_task(_until_disconnect(websocket))
+    events = []
+    try:
+        while True:
+            waiter = asyncio.create_task(svc.desktop.event_queue_notify.wait())
+            done, _ = await asyncio.wait({waiter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                waiter.cancel()
+                break
+            svc.desktop.event_queue_notify.clear()
+            
+            events = await svc.desktop.drain("event_queue")
+            if events:
+                await websocket.send_text(orjson.dumps(events).decode())
+                events = []
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        logger.info("Desktop client disconnected from event WebSocket")
+        # Put back anything drained but not delivered
+        if events:
+            svc.desktop.event_queue.extendleft(reversed(events))
+            svc.desktop.event_queue_notify.set()
+
+def _stream_queue(key: str, items) -> StreamingResponse:
+    """Stream a detached queue as a JSON envelope, one item at a time.
+
+    Items are popped as they are written so memory stays flat however
+    long the desktop client was offline.
+    """
+    count = len(items)
+    
+    def generate():
+        yield b'{"status":"success","' + key.encode() + b'":['
+        separator = b""
+        while items:
+            yield separator + orjson.dumps(items.popleft())
+            separator = b","
+        yield b'],"count":%d,"timestamp":%s}' % (count, orjson.dumps(now_iso()))
+    
+    return StreamingResponse(generate(), media_type="application/json")
+
 @router.get("/desktop/queue/sessions")
-async def get_queued_sessions():
+async def get_queued_sessions(svc: Services = Depends(get_services)):
     """Get queued session data for desktop client"""
-    if not desktop_service:
-        init_services()
-    
     try:
-        sessions = desktop_service.session_data_queue.copy()
-        desktop_service.session_data_queue.clear()  # Clear queue after retrieval
-        
-        return {
-            "status": "success",
-            "sessions": sessions,
-            "count": len(sessions),
-            "timestamp": datetime.now().isoformat()
-        }
+        sessions = await svc.desktop.detach("session_data_queue")
+        return _stream_queue("sessions", sessions)
     except Exception as e:
-        logger.error(f"Error getting queued sessions: {e}")
+        logger.error("Error getting queued sessions: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/desktop/queue/notifications")
-async def get_queued_notifications():
+async def get_queued_notifications(svc: Services = Depends(get_services)):
     """Get queued notifications for desktop client"""
-    if not desktop_service:
-        init_services()
-    
     try:
-        notifications = desktop_service.notification_queue.copy()
-        desktop_service.notification_queue.clear()  # Clear queue after retrieval
-        
-        return {
-            "status": "success", 
-            "notifications": notifications,
-            "count": len(notifications),
-            "timestamp": datetime.now().isoformat()
-        }
+        notifications = await svc.desktop.detach("notification_queue")
+        return _stream_queue("notifications", notifications)
     except Exception as e:
-        logger.error(f"Error getting queued notifications: {e}")
+        logger.error("Error getting queued notifications: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-class DesktopCommandRequest(BaseModel):
+class DesktopCommandRequest(RequestModel):
     command: str
     child_profile: Optional[str] = None
     parameters: Optional[Dict[str, Any]] = None
 
+async def _do_force_close(request: DesktopCommandRequest, svc: Services) -> Optional[Dict[str, Any]]:
+    if request.child_profile:
+        success = await svc.monitor.force_close_roblox(
+            f"Remote command from mobile app for {request.child_profile}"
+        )
+        return {
+            "status": "success" if success else "error",
+            "message": "Roblox closed" if success else "Failed to close Roblox",
+            "command": request.command
+        }
+    return None
+
+async def _do_set_time_limit(request: DesktopCommandRequest, svc: Services) -> Optional[Dict[str, Any]]:
+    if request.child_profile and request.parameters and "minutes" in request.parameters:
+        svc.session_manager.set_time_limit(
+            request.child_profile, 
+            request.parameters["minutes"]
+        )
+        return {
+            "status": "success",
+            "message": f"Time limit set to {request.parameters['minutes']} minutes",
+            "command": request.command
+        }
+    return None
+
+async def _do_get_live_status(request: DesktopCommandRequest, svc: Services) -> Optional[Dict[str, Any]]:
+    if request.child_profile:
+        session_data = svc.session_manager.get_live_session(request.child_profile)
+        roblox_status = await run_blocking(svc, svc.monitor.get_roblox_status)
+        return {
+            "status": "success",
+            "data": {
+                "session": session_data,
+                "roblox_status": roblox_status
+            },
+            "command": request.command
+        }
+    return None
+
+# Desktop command name -> handler; a handler returns None when the command's
+# arguments are missing, which is reported the same as an unknown command
+_COMMAND_HANDLERS: Dict[str, Callable[[DesktopCommandRequest, Services], Awaitable[Optional[Dict[str, Any]]]]] = {
+    "force_close_roblox": _do_force_close,
+    "set_time_limit": _do_set_time_limit,
+    "get_live_status": _do_get_live_status,
+}
+
 @router.post("/desktop/command")
-async def receive_desktop_command(request: DesktopCommandRequest):
+async def receive_desktop_command(request: DesktopCommandRequest, svc: Services = Depends(get_services)):
     """Receive commands from desktop client (e.g., from mobile app via Firebase)"""
-    if not monitor_service or not session_manager:
-        init_services()
-    
     try:
-        result = {"status": "error", "message": "Unknown command"}
-        
-        if request.command == "force_close_roblox":
-            if request.child_profile:
-                success = await monitor_service.force_close_roblox(
-                    f"Remote command from mobile app for {request.child_profile}"
-                )
-                result = {
-                    "status": "success" if success else "error",
-                    "message": "Roblox closed" if success else "Failed to close Roblox",
-                    "command": request.command
-                }
-            
-        elif request.command == "set_time_limit":
-            if request.child_profile and request.parameters and "minutes" in request.parameters:
-                session_manager.set_time_limit(
-                    request.child_profile, 
-                    request.parameters["minutes"]
-                )
-                result = {
-                    "status": "success",
-                    "message": f"Time limit set to {request.parameters['minutes']} minutes",
-                    "command": request.command
-                }
-                
-        elif request.command == "get_live_status":
-            if request.child_profile:
-                session_data = session_manager.get_live_session(request.child_profile)
-                roblox_status = monitor_service.get_roblox_status()
-                result = {
-                    "status": "success",
-                    "data": {
-                        "session": session_data,
-                        "roblox_status": roblox_status
-                    },
-                    "command": request.command
-                }
+        result = None
+        handler = _COMMAND_HANDLERS.get(request.command)
+        if handler:
+            result = await handler(request, svc)
         
-        return result
+        return result or {"status": "error", "message": "Unknown command"}
         
     except Exception as e:
-        logger.error(f"Error processing desktop command: {e}")
+        logger.error("Error processing desktop command: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,101 +1,207 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from api.routes import router as api_router
+from fastapi.responses import ORJSONResponse, Response
+from api.routes import router as api_router, create_services, compute_etag, etag_matches
+from utils.process_monitor import load_config, get_unix_socket_path
 import asyncio
-from contextlib import asynccontextmanager
-from utils.process_monitor import (
-    ProcessMonitorService, 
-    NotificationService, 
-    SystemInfoService, 
-    SessionManager,
-    DesktopClientService,
-    load_config
-)
+from anyio import to_thread
+from contextlib import asynccontextmanager, contextmanager
 import logging
+import logging.handlers
+import orjson
+import queue
+import signal
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global services
-monitor_service = None
-notification_service = None
-system_info_service = None
-session_manager = None
-desktop_service = None
+def _start_log_listener():
+    """Route root log records through a queue so handler I/O happens on a
+    listener thread instead of on request and monitoring paths.
+
+    Returns the listener and the root handlers it replaced, for
+    _stop_log_listener to put back.
+    """
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener, handlers
+
+def _stop_log_listener(listener, handlers):
+    """Flush the log queue and write records directly again"""
+    listener.stop()
+    logging.getLogger().handlers = handlers
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Started and stopped with the app, so each lifespan gets its own
+    # listener and nothing is left queued once it ends
+    log_listener = _start_log_listener()
+    try:
+        async with _run_services(app):
+            yield
+    finally:
+        _stop_log_listener(*log_listener)
+
+@asynccontextmanager
+async def _run_services(app: FastAPI):
     # Startup
     logger.info("Starting Roblox Parental Control Backend...")
     
-    global monitor_service, notification_service, system_info_service, session_manager, desktop_service
-    
-    # Initialize services
-    monitor_service = ProcessMonitorService()
-    notification_service = NotificationService()
-    system_info_service = SystemInfoService()
-    session_manager = SessionManager()
-    desktop_service = DesktopClientService()
+    # Sync endpoints run on the anyio threadpool; raise its default 40-thread
+    # limit so concurrent pollers cannot exhaust it
+    to_thread.current_default_thread_limiter().total_tokens = 200
     
-    # Link services together
-    monitor_service.set_session_manager(session_manager)
-    monitor_service.set_desktop_service(desktop_service)
-    session_manager.set_desktop_service(desktop_service)
+    # Initialize and link services now that the event loop is running.
+    # The API routes receive these from app.state via Depends.
+    services = app.state.services = create_services()
     
     # Initialize WebSocket server for real-time communication
-    await desktop_service.init_websocket_server()
-    
-    # Load configuration
-    config = load_config()
+    await services.desktop.init_websocket_server()
     
     # Start monitoring service
-    await monitor_service.start()
+    await services.monitor.start()
+    await services.system_info.start()
     
-    logger.info("Backend services started successfully")
+    logger.info(f"Backend services started successfully (event loop: {type(asyncio.get_running_loop()).__name__})")
     
     yield
     
     # Shutdown
     logger.info("Shutting down backend services...")
-    if monitor_service:
-        await monitor_service.stop()
+    # Shielded so a second interrupt during shutdown cannot abandon the
+    # monitor task or the WebSocket server half-stopped
+    await asyncio.shield(services.monitor.stop())
+    await asyncio.shield(services.system_info.stop())
+    await asyncio.shield(services.desktop.flush())
+    if services.desktop.websocket_server:
+        await asyncio.shield(services.desktop.websocket_server.stop_server())
+    services.io_pool.shutdown(wait=False, cancel_futures=True)
+    services.notification.close()
     logger.info("Backend shutdown complete")
 
 app = FastAPI(
     title="Roblox Parental Control Backend",
     description="Backend service for monitoring and controlling Roblox sessions",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware for Flutter app
+# Add CORS middleware for Flutter app. Origins are named explicitly (a
+# wildcard origin cannot be combined with credentials) and preflight
+# responses are cacheable for a day so browsers skip repeat OPTIONS calls.
+DEFAULT_CORS_ORIGINS = ["http://localhost:8100", "https://parental.app"]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=load_config().get("server", {}).get("cors_origins", DEFAULT_CORS_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "If-None-Match"],
+    max_age=86400,
 )
 
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for Flutter client"""
-    return {
+# The health payload only varies with the monitor state, so both possible
+# bodies and their headers are encoded once and served as-is
+HEALTH_CACHE_CONTROL = "max-age=1"
+
+def _prebuild_health(monitor_running: bool):
+    body = orjson.dumps({
         "status": "healthy",
         "version": "1.0.0",
         "services": {
-            "monitor": monitor_service.is_running() if monitor_service else False,
+            "monitor": monitor_running,
             "notifications": True,
             "system_info": True
         }
-    }
+    })
+    return body, {"ETag": compute_etag(body), "Cache-Control": HEALTH_CACHE_CONTROL}
+
+_HEALTH_RESPONSES = {running: _prebuild_health(running) for running in (True, False)}
+
+# Health check endpoint
+@app.get("/health")
+def health_check(request: Request):
+    """Health check endpoint for Flutter client"""
+    body, headers = _HEALTH_RESPONSES[request.app.state.services.monitor.is_running()]
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # Include all API routes
 app.include_router(api_router)
 
 if __name__ == "__main__":
     import uvicorn
-    print("Starting Roblox Parental Control Backend on http://localhost:8000")
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    
+    config = load_config()
+    server_config = config.get("server", {})
+    host = server_config.get("host", "0.0.0.0")
+    port = server_config.get("port", 8000)
+    uds_path = get_unix_socket_path(config)
+    
+    print(f"Starting Roblox Parental Control Backend on http://localhost:{port}")
+    if uds_path:
+        # Serve the co-located desktop client over a UNIX socket alongside TCP.
+        # Only the TCP server runs the lifespan so services start once.
+        print(f"Desktop client UNIX socket: {uds_path}")
+        
+        class SharedSignalServer(uvicorn.Server):
+            """Leaves SIGINT/SIGTERM to serve_all, so one signal stops both servers"""
+            
+            def install_signal_handlers(self):  # uvicorn < 0.29
+                pass
+            
+            @contextmanager
+            def capture_signals(self):  # uvicorn >= 0.29
+                yield
+        
+        tcp_server = SharedSignalServer(uvicorn.Config(app, host=host, port=port))
+        uds_server = SharedSignalServer(uvicorn.Config(app, uds=uds_path, lifespan="off"))
+        
+        async def serve_all():
+            loop = asyncio.get_running_loop()
+            
+            def stop(sig):
+                for server in (tcp_server, uds_server):
+                    server.handle_exit(sig, None)
+            
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, stop, sig)
+                except NotImplementedError:  # Windows event loops
+                    signal.signal(sig, lambda sig, frame: loop.call_soon_threadsafe(stop, sig))
+            
+            tcp_task = asyncio.create_task(tcp_server.serve())
+            # The UDS server skips the lifespan, so it only starts accepting
+            # once the TCP server's lifespan has brought the services up
+            while not tcp_server.started and not tcp_task.done():
+                await asyncio.sleep(0.05)
+            if tcp_server.started:
+                await asyncio.gather(tcp_task, uds_server.serve())
+            else:
+                await tcp_task
+        
+        # uvicorn.run picks uvloop itself; asyncio.run needs the policy set explicitly
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass  # uvicorn[standard] does not install uvloop on Windows
+        asyncio.run(serve_all())
+    else:
+        # loop/http "auto" select uvloop and httptools from uvicorn[standard]
+        # when available. The reloader is for development only.
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            loop="auto",
+            http="auto",
+            reload=server_config.get("debug", False)
+        )
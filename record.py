@@ -1,17 +1,78 @@
 import datetime
-import json
+import functools
+import operator
+import orjson
+import time
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Literal, Optional, Sequence, Union
 from enum import Enum
 
+_UTC = datetime.timezone.utc
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+
+JsonInput = Union[Dict[str, Any], bytes, str]
+
+def dumps(obj: Any) -> bytes:
+    """Encode a to_json() dict; datetimes, times and enums are handled by orjson"""
+    return orjson.dumps(obj)
+
+def _as_dict(data: JsonInput) -> Dict[str, Any]:
+    """Accept either an already-decoded dict or raw JSON bytes/str"""
+    if isinstance(data, (bytes, bytearray, memoryview, str)):
+        return orjson.loads(data)
+    return data
+
+# Both are the C isoformat parsers
+_datetime_fromiso = datetime.datetime.fromisoformat
+_time_fromiso = datetime.time.fromisoformat
+
+def _parse_datetime(value: Union[datetime.datetime, str]) -> datetime.datetime:
+    return value if isinstance(value, datetime.datetime) else _datetime_fromiso(value)
+
+def _parse_time(value: Union[datetime.time, str]) -> datetime.time:
+    if isinstance(value, datetime.time):
+        return value
+    # Older profiles stored bedtime as a full datetime string
+    return _datetime_fromiso(value).time() if 'T' in value else _time_fromiso(value)
+
 class ProfileType(Enum):
     CHILD = "child"
     PARENT = "parent" 
     ADMIN = "admin"
 
+# Display strings depend only on a whole number of minutes, so each distinct
+# value is formatted once and shared by every profile/session showing it
+@functools.lru_cache(maxsize=1024)
+def _format_time_limit(total_minutes: int) -> str:
+    hours, minutes = divmod(total_minutes, 60)
+    if hours > 0 and minutes > 0:
+        return "%dh %dm" % (hours, minutes)
+    elif hours > 0:
+        return "%dh" % hours
+    else:
+        return "%dm" % minutes
+
+@functools.lru_cache(maxsize=1024)
+def _format_duration(total_minutes: int) -> str:
+    return "%dh %dm" % divmod(total_minutes, 60)
+
+# Shared by every profile created without its own list; never mutated
+_DEFAULT_ALLOWED_DAYS = (
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+)
+
+# Stored values and the members themselves (as found in to_json() dicts)
+_PROFILE_TYPE_BY_VALUE = {**{t.value: t for t in ProfileType}, **{t: t for t in ProfileType}}
+
 class Profile:
     """Profile class matching Flutter model"""
     
+    # Slot names double as the to_json() keys, in the same order
+    __slots__ = (
+        "id", "name", "type", "auto_close", "daily_time_limit", "bedtime",
+        "allowed_days", "avatar_url", "created_at", "last_active", "settings"
+    )
+    
     def __init__(
         self,
         profile_id: str,
@@ -20,9 +81,11 @@ class Profile:
         auto_close: bool = True,
         daily_time_limit: int = 120,  # minutes
         bedtime: Optional[datetime.time] = None,
-        allowed_days: list = None,
+        allowed_days: Optional[Sequence[str]] = None,
         avatar_url: Optional[str] = None,
-        settings: Optional[Dict[str, Any]] = None
+        settings: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime.datetime] = None,
+        last_active: Optional[datetime.datetime] = None
     ):
         self.id = profile_id
         self.name = name
@@ -30,83 +93,76 @@ class Profile:
         self.auto_close = auto_close
         self.daily_time_limit = daily_time_limit
         self.bedtime = bedtime
-        self.allowed_days = allowed_days or [
-            'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
-        ]
+        self.allowed_days = allowed_days or _DEFAULT_ALLOWED_DAYS
         self.avatar_url = avatar_url
-        self.created_at = datetime.datetime.now(datetime.timezone.utc)
-        self.last_active = datetime.datetime.now(datetime.timezone.utc)
+        # Read the clock only for timestamps the caller did not supply
+        if created_at is None or last_active is None:
+            now = datetime.datetime.now(_UTC)
+            created_at = created_at or now
+            last_active = last_active or now
+        self.created_at = created_at
+        self.last_active = last_active
         self.settings = settings or {}
     
     @classmethod
-    def from_json(cls, data: Dict[str, Any]) -> 'Profile':
+    def from_json(cls, data: JsonInput) -> 'Profile':
         """Create Profile from JSON data"""
-        profile_type = ProfileType.CHILD
-        if 'type' in data:
-            try:
-                profile_type = ProfileType(data['type'])
-            except ValueError:
-                profile_type = ProfileType.CHILD
+        data = _as_dict(data)
+        raw_type = data.get('type')
+        # Unhashable values (lists, dicts) would raise in the lookup
+        if isinstance(raw_type, (str, ProfileType)):
+            profile_type = _PROFILE_TYPE_BY_VALUE.get(raw_type, ProfileType.CHILD)
+        else:
+            profile_type = ProfileType.CHILD
         
         bedtime = None
         if 'bedtime' in data and data['bedtime']:
-            bedtime = datetime.datetime.fromisoformat(data['bedtime']).time()
-        
-        created_at = datetime.datetime.now(datetime.timezone.utc)
-        if 'created_at' in data and data['created_at']:
-            created_at = datetime.datetime.fromisoformat(data['created_at'])
+            bedtime = _parse_time(data['bedtime'])
         
-        last_active = datetime.datetime.now(datetime.timezone.utc)
-        if 'last_active' in data and data['last_active']:
-            last_active = datetime.datetime.fromisoformat(data['last_active'])
+        # Missing timestamps are filled in by __init__
+        created_at = _parse_datetime(data['created_at']) if data.get('created_at') else None
+        last_active = _parse_datetime(data['last_active']) if data.get('last_active') else None
         
-        profile = cls(
-            profile_id=data.get('id', str(uuid.uuid4())),
+        return cls(
+            profile_id=data['id'] if 'id' in data else str(uuid.uuid4()),
             name=data.get('name', 'Untitled Profile'),
             profile_type=profile_type,
             auto_close=data.get('auto_close', True),
             daily_time_limit=data.get('daily_time_limit', 120),
             bedtime=bedtime,
-            allowed_days=data.get('allowed_days', [
-                'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
-            ]),
+            allowed_days=data.get('allowed_days'),
             avatar_url=data.get('avatar_url'),
-            settings=data.get('settings', {})
+            settings=data.get('settings', {}),
+            created_at=created_at,
+            last_active=last_active
         )
-        
-        profile.created_at = created_at
-        profile.last_active = last_active
-        
-        return profile
     
     def to_json(self) -> Dict[str, Any]:
-        """Convert Profile to JSON"""
+        """Convert Profile to a JSON-ready dict (encode with dumps())"""
         return {
             'id': self.id,
             'name': self.name,
-            'type': self.type.value,
+            'type': self.type,
             'auto_close': self.auto_close,
             'daily_time_limit': self.daily_time_limit,
-            'bedtime': self.bedtime.isoformat() if self.bedtime else None,
+            'bedtime': self.bedtime,
             'allowed_days': self.allowed_days,
             'avatar_url': self.avatar_url,
-            'created_at': self.created_at.isoformat(),
-            'last_active': self.last_active.isoformat(),
+            'created_at': self.created_at,
+            'last_active': self.last_active,
             'settings': self.settings
         }
     
+    @classmethod
+    def dump_many(cls, profiles) -> bytes:
+        """Encode a collection of profiles as one JSON array in a single orjson call"""
+        keys = cls.__slots__
+        return orjson.dumps([dict(zip(keys, _PROFILE_FIELDS(p))) for p in profiles])
+    
     @property
     def formatted_time_limit(self) -> str:
         """Get formatted time limit string"""
-        hours = self.daily_time_limit // 60
-        minutes = self.daily_time_limit % 60
-        
-        if hours > 0 and minutes > 0:
-            return f"{hours}h {minutes}m"
-        elif hours > 0:
-            return f"{hours}h"
-        else:
-            return f"{minutes}m"
+        return _format_time_limit(self.daily_time_limit)
     
     @property
     def is_admin(self) -> bool:
@@ -120,9 +176,16 @@ class Profile:
     def is_child(self) -> bool:
         return self.type == ProfileType.CHILD
 
+_PROFILE_FIELDS = operator.attrgetter(*Profile.__slots__)
+
 class SessionRecord:
     """Enhanced session record class matching Flutter model"""
     
+    __slots__ = (
+        "session_id", "child_profile", "time_start", "time_end", "duration", "metadata",
+        "_start_monotonic"
+    )
+    
     def __init__(
         self,
         child_profile: str = None,
@@ -135,10 +198,13 @@ class SessionRecord:
         self.time_end: Optional[datetime.datetime] = None
         self.duration: Optional[datetime.timedelta] = None
         self.metadata = metadata or {}
+        # Set by start(); lets a running duration be measured without a wall-clock read
+        self._start_monotonic: Optional[float] = None
         
     @classmethod
-    def from_json(cls, data: Dict[str, Any]) -> 'SessionRecord':
+    def from_json(cls, data: JsonInput) -> 'SessionRecord':
         """Create SessionRecord from JSON data"""
+        data = _as_dict(data)
         session = cls(
             child_profile=data.get('child_profile'),
             session_id=data.get('session_id'),
@@ -146,43 +212,60 @@ class SessionRecord:
         )
         
         if 'time_start' in data and data['time_start']:
-            session.time_start = datetime.datetime.fromisoformat(data['time_start'])
+            session.time_start = _parse_datetime(data['time_start'])
         
         if 'time_end' in data and data['time_end']:
-            session.time_end = datetime.datetime.fromisoformat(data['time_end'])
+            session.time_end = _parse_datetime(data['time_end'])
         
         session._calculate_duration()
         return session
     
     def to_json(self) -> Dict[str, Any]:
-        """Convert SessionRecord to JSON"""
+        """Convert SessionRecord to a JSON-ready dict (encode with dumps())"""
+        return self._dump("v2")
+    
+    def _dump(self, schema: Literal["v1", "v2"]) -> Dict[str, Any]:
+        """Shared serializer: "v2" is the Flutter model, "v1" the legacy Record shape"""
+        duration = self.duration
+        if schema == "v1":
+            return {
+                'time_start': self.time_start,
+                'time_end': self.time_end,
+                'session_id': self.session_id,
+                'duration_seconds': duration.total_seconds() if duration else 0
+            }
         return {
-            'time_start': self.time_start.isoformat() if self.time_start else None,
-            'time_end': self.time_end.isoformat() if self.time_end else None,
+            'time_start': self.time_start,
+            'time_end': self.time_end,
             'child_profile': self.child_profile,
             'session_id': self.session_id,
-            'duration_minutes': self.duration.total_seconds() // 60 if self.duration else None,
+            'duration_minutes': duration.total_seconds() // 60 if duration else None,
             'metadata': self.metadata
         }
     
     def start(self):
         """Start the session"""
-        self.time_start = datetime.datetime.now(datetime.timezone.utc)
+        now_ns = time.time_ns()
+        self.time_start = _EPOCH + datetime.timedelta(microseconds=now_ns // 1000)
+        self._start_monotonic = time.monotonic()
         if not self.session_id:
-            self.session_id = f"{self.child_profile}_{int(self.time_start.timestamp() * 1000)}"
+            self.session_id = f"{self.child_profile}_{now_ns // 1_000_000}"
         self._calculate_duration()
     
     def end(self):
         """End the session"""
-        self.time_end = datetime.datetime.now(datetime.timezone.utc)
+        self.time_end = datetime.datetime.now(_UTC)
         self._calculate_duration()
     
     def _calculate_duration(self):
         """Calculate session duration"""
         if self.time_start and self.time_end:
             self.duration = self.time_end - self.time_start
+        elif self._start_monotonic is not None:
+            self.duration = datetime.timedelta(seconds=time.monotonic() - self._start_monotonic)
         elif self.time_start:
-            self.duration = datetime.datetime.now(datetime.timezone.utc) - self.time_start
+            # Running session restored from JSON; only the wall-clock start is known
+            self.duration = datetime.datetime.now(_UTC) - self.time_start
         else:
             self.duration = None
     
@@ -197,11 +280,7 @@ class SessionRecord:
         if not self.duration:
             return "0h 0m"
         
-        total_seconds = int(self.duration.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        
-        return f"{hours}h {minutes}m"
+        return _format_duration(int(self.duration.total_seconds()) // 60)
     
     @property
     def formatted_time_range(self) -> str:
@@ -220,22 +299,24 @@ class SessionRecord:
         
         return f"{start_str} - {end_str}"
     
+    @classmethod
+    def dump_many(cls, sessions) -> bytes:
+        """Encode a collection of sessions as one JSON array in a single orjson call"""
+        return orjson.dumps([session.to_json() for session in sessions])
+    
     def convert_to_json(self) -> Dict[str, Any]:
         """Legacy method for backward compatibility"""
-        return self.to_json()
+        return self._dump("v2")
 
 # Legacy Record class for backward compatibility
 class Record(SessionRecord):
     """Legacy Record class that extends SessionRecord for compatibility"""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(child_profile="default_child")
         
     def convert_to_json(self) -> Dict[str, Any]:
-        """Legacy JSON conversion method"""
-        return {
-            "time_start": self.time_start.isoformat() if self.time_start else None,
-            "time_end": self.time_end.isoformat() if self.time_end else None,
-            "session_id": self.session_id,
-            "duration_seconds": self.duration.total_seconds() if self.duration else 0
-        }
+        """Legacy JSON conversion method (encode with dumps())"""
+        return self._dump("v1")
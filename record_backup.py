@@ -1,24 +1,57 @@
 import datetime
+import logging
+import time
+
+_log = logging.getLogger("record")
+
+# Wall-clock anchor taken once per process; monotonic readings are mapped onto
+# it so start()/end() only need a single monotonic_ns() call
+_MONO_ANCHOR_NS = time.monotonic_ns()
+_WALL_ANCHOR_NS = time.time_ns()
+_UTC = datetime.timezone.utc
+
+
+def _to_datetime(mono_ns):
+    return datetime.datetime.fromtimestamp(
+        (_WALL_ANCHOR_NS + mono_ns - _MONO_ANCHOR_NS) / 1e9, tz=_UTC
+    )
 
 
 class Record:
-    time_start: datetime.datetime = None
-    time_end: datetime.datetime = None
+    __slots__ = ("t_start_ns", "t_end_ns")
 
     def __init__(self):
-        self.time_start = None
-        self.time_end = None
+        self.t_start_ns = None
+        self.t_end_ns = None
+
+    @property
+    def time_start(self):
+        return _to_datetime(self.t_start_ns) if self.t_start_ns is not None else None
+
+    @property
+    def time_end(self):
+        return _to_datetime(self.t_end_ns) if self.t_end_ns is not None else None
+
+    @property
+    def duration_seconds(self):
+        if self.t_start_ns is None or self.t_end_ns is None:
+            return 0
+        return (self.t_end_ns - self.t_start_ns) / 1e9
 
     def start(self):
-        self.time_start = datetime.datetime.now(datetime.timezone.utc)
-        print(f"Recording started at {self.time_start}")
+        self.t_start_ns = time.monotonic_ns()
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Recording started at %s", self.time_start)
 
     def end(self):
-        self.time_end = datetime.datetime.now(datetime.timezone.utc)
-        print(f"Recording ended at {self.time_end}")
+        self.t_end_ns = time.monotonic_ns()
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Recording ended at %s", self.time_end)
 
     def convert_to_json(self):
+        time_start = self.time_start
+        time_end = self.time_end
         return {
-            "time_start": self.time_start.isoformat() if self.time_start else None,
-            "time_end": self.time_end.isoformat() if self.time_end else None
+            "time_start": time_start.isoformat() if time_start else None,
+            "time_end": time_end.isoformat() if time_end else None
         }
@@ -0,0 +1,39 @@
+import time
+from datetime import datetime
+
+# How long a formatted timestamp is reused before being rebuilt
+TIMESTAMP_RESOLUTION = 0.05  # seconds
+
+_cached_iso = ""
+_cached_at = float("-inf")
+
+def now_iso() -> str:
+    """Return the current local time as an ISO string, rebuilt at most every 50 ms.
+
+    Response payloads only need coarse timestamps, so hot endpoints share one
+    formatted string instead of each building a datetime and formatting it.
+    """
+    global _cached_iso, _cached_at
+    now = time.monotonic()
+    if now - _cached_at >= TIMESTAMP_RESOLUTION:
+        _cached_iso = datetime.now().isoformat()
+        _cached_at = now
+    return _cached_iso
+
+# (seconds, "YYYY-MM-DDTHH:MM:SS" prefix) for the last second formatted; one
+# tuple so threads never see a prefix from a different second
+_utc_cache = (None, "")
+
+def utc_iso_now() -> str:
+    """Return the current UTC time in the form datetime.now(timezone.utc).isoformat() gives.
+
+    Built from time.time_ns() without creating a datetime; the date and
+    time-of-day prefix is only re-formatted when the second changes.
+    """
+    global _utc_cache
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_secs, prefix = _utc_cache
+    if secs != cached_secs:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        _utc_cache = (secs, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
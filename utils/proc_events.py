@@ -0,0 +1,337 @@
+import asyncio
+import logging
+import os
+import select
+import socket
+import struct
+import sys
+import threading
+from typing import Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Linux proc connector (linux/connector.h, linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_EXIT = 0x80000000
+NLMSG_DONE = 3
+
+_NLMSGHDR = struct.Struct("=IHHII")  # len, type, flags, seq, pid
+_CN_MSG = struct.Struct("=IIIIHH")  # idx, val, seq, ack, len, flags
+_PROC_EVENT = struct.Struct("=IIQ")  # what, cpu, timestamp_ns
+_EVENT_PIDS = struct.Struct("=ii")  # process_pid, process_tgid (exec and exit)
+_EVENT_OFFSET = _NLMSGHDR.size + _CN_MSG.size + _PROC_EVENT.size
+
+# on_exec(pid, name) / on_exit(pid, name); name is None when the source does not supply it
+ProcCallback = Callable[[int, Optional[str]], None]
+
+class NetlinkProcWatcher:
+    """Receive process exec/exit events from the Linux kernel proc connector.
+
+    Needs CAP_NET_ADMIN; start() returns False when the connector cannot be
+    used so callers can fall back to polling. Callbacks run on the event loop.
+    """
+
+    def __init__(self, on_exec: ProcCallback, on_exit: ProcCallback):
+        self._on_exec = on_exec
+        self._on_exit = on_exit
+        self._sock: Optional[socket.socket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+        except OSError as e:
+            logger.info("Proc connector unavailable, polling for processes: %s", e)
+            return False
+        try:
+            sock.bind((0, CN_IDX_PROC))
+            op = struct.pack("=I", PROC_CN_MCAST_LISTEN)
+            header = _NLMSGHDR.pack(_NLMSGHDR.size + _CN_MSG.size + len(op), NLMSG_DONE, 0, 0, os.getpid())
+            sock.send(header + _CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(op), 0) + op)
+            sock.setblocking(False)
+        except OSError as e:
+            sock.close()
+            logger.info("Proc connector subscription refused, polling for processes: %s", e)
+            return False
+        self._sock = sock
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(sock.fileno(), self._read)
+        return True
+
+    def close(self):
+        if self._sock is not None:
+            self._loop.remove_reader(self._sock.fileno())
+            self._sock.close()
+            self._sock = None
+
+    def _read(self):
+        while True:
+            try:
+                data = self._sock.recv(4096)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                # ENOBUFS: the kernel dropped events; the caller's periodic
+                # rescan picks up whatever was missed
+                logger.warning("Proc connector read failed: %s", e)
+                return
+            if len(data) < _EVENT_OFFSET + _EVENT_PIDS.size:
+                continue
+            what = _PROC_EVENT.unpack_from(data, _NLMSGHDR.size + _CN_MSG.size)[0]
+            if what != PROC_EVENT_EXEC and what != PROC_EVENT_EXIT:
+                continue
+            pid, tgid = _EVENT_PIDS.unpack_from(data, _EVENT_OFFSET)
+            if pid != tgid:
+                continue  # A thread, not a process
+            if what == PROC_EVENT_EXEC:
+                self._on_exec(pid, None)
+            else:
+                self._on_exit(pid, None)
+
+class WmiProcWatcher:
+    """Receive Win32_Process creation/deletion events for Roblox from WMI.
+
+    WMI blocks, so each event type is watched from its own thread and handed
+    to the event loop with call_soon_threadsafe. If a watcher thread fails,
+    on_error (when given) is called on the loop.
+    """
+
+    def __init__(self, on_exec: ProcCallback, on_exit: ProcCallback, name_filter: Callable[[str], bool],
+                 on_error: Optional[Callable[[], None]] = None):
+        self._callbacks = {"creation": on_exec, "deletion": on_exit}
+        self._name_filter = name_filter
+        self._on_error = on_error
+        self._stopping = threading.Event()
+
+    def start(self) -> bool:
+        if sys.platform != "win32":
+            return False
+        try:
+            import wmi  # noqa: F401
+        except ImportError:
+            logger.info("wmi not available, polling for processes")
+            return False
+        loop = asyncio.get_running_loop()
+        for notification_type in self._callbacks:
+            threading.Thread(
+                target=self._watch,
+                args=(notification_type, loop),
+                name=f"wmi-{notification_type}",
+                daemon=True
+            ).start()
+        return True
+
+    def close(self):
+        self._stopping.set()
+
+    def _watch(self, notification_type: str, loop: asyncio.AbstractEventLoop):
+        import pythoncom
+        import wmi
+        pythoncom.CoInitialize()  # WMI is COM; each watcher thread needs its own apartment
+        try:
+            watcher = wmi.WMI().Win32_Process.watch_for(notification_type)
+            callback = self._callbacks[notification_type]
+            while not self._stopping.is_set():
+                try:
+                    # Time out now and then so close() is noticed
+                    proc = watcher(timeout_ms=1000)
+                except wmi.x_wmi_timed_out:
+                    continue
+                if self._name_filter(proc.Name):
+                    loop.call_soon_threadsafe(callback, proc.ProcessId, proc.Name)
+        except Exception as e:
+            logger.error("WMI %s watcher stopped: %s", notification_type, e)
+            if self._on_error is not None:
+                try:
+                    loop.call_soon_threadsafe(self._on_error)
+                except RuntimeError:
+                    pass  # Loop already closed during shutdown
+        finally:
+            pythoncom.CoUninitialize()
+
+def start_proc_watcher(on_exec: ProcCallback, on_exit: ProcCallback,
+                       name_filter: Callable[[str], bool]):
+    """Start the platform's process event source, or return None if there is none"""
+    for watcher in (NetlinkProcWatcher(on_exec, on_exit), WmiProcWatcher(on_exec, on_exit, name_filter)):
+        if watcher.start():
+            return watcher
+    return None
+
+class PidfdExitWatcher:
+    """Per-PID exit notification through pidfd_open (Linux 5.3+).
+
+    Each pidfd is registered with the event loop and becomes readable
+    exactly when the process exits; on_exit(pid) then runs on the loop.
+    """
+
+    def __init__(self, on_exit: Callable[[int], None]):
+        self._on_exit = on_exit
+        self._fds: Dict[int, int] = {}
+        self._loop = asyncio.get_running_loop()
+
+    @staticmethod
+    def available() -> bool:
+        return hasattr(os, "pidfd_open")
+
+    def watch(self, pid: int) -> bool:
+        if pid in self._fds:
+            return True
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:
+            return False  # Already gone
+        self._fds[pid] = fd
+        self._loop.add_reader(fd, self._fire, pid)
+        return True
+
+    def unwatch(self, pid: int):
+        fd = self._fds.pop(pid, None)
+        if fd is not None:
+            self._loop.remove_reader(fd)
+            os.close(fd)
+
+    def close(self):
+        for pid in list(self._fds):
+            self.unwatch(pid)
+
+    def _fire(self, pid: int):
+        self.unwatch(pid)
+        self._on_exit(pid)
+
+class KqueueExitWatcher:
+    """Per-PID exit notification through kqueue EVFILT_PROC/NOTE_EXIT (macOS, BSD).
+
+    One kqueue holds every watched PID; its descriptor is itself pollable,
+    so the event loop reads it like any other fd.
+    """
+
+    def __init__(self, on_exit: Callable[[int], None]):
+        self._on_exit = on_exit
+        self._pids: Set[int] = set()
+        self._kq = select.kqueue()
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._kq.fileno(), self._read)
+
+    @staticmethod
+    def available() -> bool:
+        return hasattr(select, "kqueue") and hasattr(select, "KQ_FILTER_PROC")
+
+    def watch(self, pid: int) -> bool:
+        if pid in self._pids:
+            return True
+        event = select.kevent(
+            pid,
+            filter=select.KQ_FILTER_PROC,
+            flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+            fflags=select.KQ_NOTE_EXIT
+        )
+        try:
+            self._kq.control([event], 0, 0)
+        except OSError:
+            return False  # Already gone
+        self._pids.add(pid)
+        return True
+
+    def unwatch(self, pid: int):
+        if pid in self._pids:
+            self._pids.discard(pid)
+            event = select.kevent(pid, filter=select.KQ_FILTER_PROC, flags=select.KQ_EV_DELETE)
+            try:
+                self._kq.control([event], 0, 0)
+            except OSError:
+                pass  # The one-shot event already fired
+
+    def close(self):
+        self._loop.remove_reader(self._kq.fileno())
+        self._kq.close()
+        self._pids.clear()
+
+    def _read(self):
+        for event in self._kq.control(None, 64, 0):
+            if event.ident in self._pids:
+                self._pids.discard(event.ident)
+                self._on_exit(event.ident)
+
+class WindowsExitWatcher:
+    """Per-PID exit notification through RegisterWaitForSingleObject (Windows).
+
+    The wait callback runs on a system thread-pool thread and hands the exit
+    to the event loop with call_soon_threadsafe.
+    """
+
+    SYNCHRONIZE = 0x00100000
+    INFINITE = 0xFFFFFFFF
+    WT_EXECUTEONLYONCE = 0x00000008
+
+    def __init__(self, on_exit: Callable[[int], None]):
+        import ctypes
+        from ctypes import wintypes
+        self._ctypes = ctypes
+        self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._kernel32.OpenProcess.restype = wintypes.HANDLE
+        self._on_exit = on_exit
+        self._loop = asyncio.get_running_loop()
+        # pid -> (process handle, wait handle); the callback object must stay alive
+        self._waits: Dict[int, tuple] = {}
+        callback_type = ctypes.WINFUNCTYPE(None, ctypes.c_void_p, wintypes.BOOLEAN)
+        self._callback = callback_type(self._fired)
+
+    @staticmethod
+    def available() -> bool:
+        return sys.platform == "win32"
+
+    def watch(self, pid: int) -> bool:
+        if pid in self._waits:
+            return True
+        ctypes = self._ctypes
+        handle = self._kernel32.OpenProcess(self.SYNCHRONIZE, False, pid)
+        if not handle:
+            return False  # Already gone, or not ours to wait on
+        wait_handle = ctypes.c_void_p()
+        if not self._kernel32.RegisterWaitForSingleObject(
+            ctypes.byref(wait_handle), ctypes.c_void_p(handle), self._callback,
+            ctypes.c_void_p(pid), self.INFINITE, self.WT_EXECUTEONLYONCE
+        ):
+            self._kernel32.CloseHandle(ctypes.c_void_p(handle))
+            return False
+        self._waits[pid] = (handle, wait_handle)
+        return True
+
+    def unwatch(self, pid: int):
+        entry = self._waits.pop(pid, None)
+        if entry is not None:
+            handle, wait_handle = entry
+            # INVALID_HANDLE_VALUE: wait for a running callback to finish
+            self._kernel32.UnregisterWaitEx(wait_handle, self._ctypes.c_void_p(-1))
+            self._kernel32.CloseHandle(self._ctypes.c_void_p(handle))
+
+    def close(self):
+        for pid in list(self._waits):
+            self.unwatch(pid)
+
+    def _fired(self, context, timed_out):
+        try:
+            self._loop.call_soon_threadsafe(self._dispatch, context)
+        except RuntimeError:
+            pass  # Loop already closed during shutdown
+
+    def _dispatch(self, pid: int):
+        if pid in self._waits:
+            self.unwatch(pid)
+            self._on_exit(pid)
+
+def start_exit_watcher(on_exit: Callable[[int], None]):
+    """Create the platform's per-PID exit watcher, or return None if there is none"""
+    for watcher_type in (PidfdExitWatcher, KqueueExitWatcher, WindowsExitWatcher):
+        if watcher_type.available():
+            try:
+                return watcher_type(on_exit)
+            except Exception as e:
+                logger.info("%s unavailable: %s", watcher_type.__name__, e)
+    return None
@@ -1,13 +1,19 @@
+import functools
 import psutil
 import time
 import asyncio
-import json
+import orjson
+from collections import deque
+import os
 import uuid
 import platform
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any
 from pathlib import Path
+from utils.clock import utc_iso_now
+from utils.proc_events import start_exit_watcher, start_proc_watcher
 import subprocess
 import sys
 import threading
@@ -16,49 +22,191 @@ import threading
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-ROBLOX_PROCESSES = [
+ROBLOX_PROCESSES = frozenset((
     "RobloxPlayerBeta.exe",
     "RobloxStudioBeta.exe", 
     "RobloxPlayerLauncher.exe",
     "Roblox"
-]
+))
+# Every Roblox executable name starts with this; checked without lowercasing
+_ROBLOX_PREFIXES = ("Roblox", "roblox", "ROBLOX")
+
+# Scans ask about the same few hundred names every tick, so answers are memoized;
+# call is_roblox_process_name.cache_clear() if the prefixes ever change at runtime
+@functools.lru_cache(maxsize=8192)
+def is_roblox_process_name(name: str) -> bool:
+    """Check if a process name is a Roblox process"""
+    return name.startswith(_ROBLOX_PREFIXES)
+
+# How long a process-table scan is shared between get_roblox_status callers
+STATUS_CACHE_TTL = 0.3  # seconds
+
+# How long force_close_roblox waits for killed processes to exit
+KILL_WAIT_TIMEOUT = 3  # seconds
+
+# How long a built live-session payload is reused for repeated polls
+LIVE_SESSION_CACHE_TTL = 0.5  # seconds
+
+# A Roblox executable relaunched within this long of exiting continues the
+# session instead of ending it and starting a new one
+RESTART_DEBOUNCE = 3.0  # seconds
+
+# How often SystemInfoService refreshes its CPU utilisation reading
+CPU_SAMPLE_INTERVAL = 2  # seconds
+
+# How long a built system-info payload is reused for repeated polls
+SYSTEM_INFO_CACHE_TTL = 1.0  # seconds
+
+# Default ceiling for the idle poll back-off while Roblox is absent,
+# overridden by monitor_max_interval
+MONITOR_MAX_INTERVAL = 15  # seconds
+
+# Ended sessions (and sent notifications) kept in memory; older sessions were
+# already synced by end_session
+SESSION_HISTORY_MAX = 10_000
+
+# Outbound WebSocket messages are coalesced for this long, or until this many
+# are pending, and then sent to the desktop client as one frame
+DESKTOP_FLUSH_DELAY = 0.01  # seconds
+DESKTOP_BATCH_MAX = 64
+
+# Default cap on each desktop queue while the client is away, overridden by
+# desktop_client.queue_max_items; the oldest entries drop
+DESKTOP_QUEUE_MAX = 10_000
+
+def read_comm(pid: int) -> Optional[str]:
+    """Return a process name without building a psutil.Process.
+    
+    On Linux this is /proc/<pid>/comm (truncated to 15 characters); other
+    platforms go through psutil. None if the process is gone.
+    """
+    if sys.platform.startswith("linux"):
+        # Raw openat/read/close: open() would add an fstat, an isatty ioctl
+        # and a file object per PID, which dominates a full /proc scan
+        try:
+            fd = os.open(f"/proc/{pid}/comm", os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            return os.read(fd, 64).rstrip(b"\n").decode(errors="replace")
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+    try:
+        return psutil.Process(pid).name()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+def iter_process_names():
+    """Yield (pid, name) for every running process.
+
+    On Linux this reads /proc/<pid>/comm directly rather than going through
+    psutil.process_iter, which builds a Process object (and runs its PID-reuse
+    check) for every PID on the system. Note that comm is truncated to 15
+    characters; callers that need the full name should resolve it via
+    psutil.Process(pid) for the matches only.
+    """
+    if sys.platform.startswith("linux"):
+        # Closed even if the caller stops early, so the /proc fd is not left to GC
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                pid = int(entry.name)
+                name = read_comm(pid)
+                if name is not None:
+                    yield pid, name
+        return
+    
+    for proc in psutil.process_iter(['pid', 'name']):
+        if proc.info['name']:
+            yield proc.info['pid'], proc.info['name']
+
+def _kill_processes(targets: List[Tuple[str, psutil.Process]]) -> List[psutil.Process]:
+    """Kill each (name, Process), returning the processes signalled"""
+    killed = []
+    for name, proc in targets:
+        try:
+            logger.info(f"Killing process: {name} (PID: {proc.pid})")
+            proc.kill()
+            killed.append(proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            logger.warning(f"Could not kill process: {e}")
+    return killed
+
+async def _kill_all_roblox_processes() -> List[psutil.Process]:
+    """Kill all Roblox processes without a monitor instance or its caches"""
+    targets = []
+    for pid, name in iter_process_names():
+        if not is_roblox_process_name(name):
+            continue
+        try:
+            proc = psutil.Process(pid)
+            targets.append((proc.name(), proc))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return _kill_processes(targets)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 class SessionRecord:
     """Session record class matching Flutter model"""
+    
+    __slots__ = (
+        "session_id", "child_profile", "time_start", "time_end", "duration_seconds",
+        "duration_minutes", "metadata", "is_active", "_time_start_iso", "_time_end_iso", "_monotonic_start"
+    )
+    
     def __init__(self, child_profile: str = None):
         self.session_id = None
         self.child_profile = child_profile
         self.time_start = None
         self.time_end = None
         self.duration_seconds = 0
+        self.duration_minutes = 0  # whole minutes of duration_seconds, fixed at end()
         self.metadata = {}
         self.is_active = False
+        # ISO strings are formatted once at start()/end() rather than per to_dict()
+        self._time_start_iso = None
+        self._time_end_iso = None
+        self._monotonic_start = None  # durations are measured on the monotonic clock
     
     def start(self):
         """Start a new session"""
-        self.time_start = datetime.now(timezone.utc)
-        self.session_id = f"{self.child_profile}_{int(self.time_start.timestamp() * 1000)}"
+        now_ns = time.time_ns()
+        self._monotonic_start = time.monotonic()
+        self.time_start = _EPOCH + timedelta(microseconds=now_ns // 1000)
+        self._time_start_iso = self.time_start.isoformat()
+        self.session_id = f"{self.child_profile}_{now_ns // 1_000_000}"
         self.is_active = True
         logger.info(f"Session started: {self.session_id}")
     
     def end(self):
         """End the current session"""
         if self.is_active:
-            self.time_end = datetime.now(timezone.utc)
-            if self.time_start:
-                self.duration_seconds = (self.time_end - self.time_start).total_seconds()
+            self.time_end = _EPOCH + timedelta(microseconds=time.time_ns() // 1000)
+            self._time_end_iso = self.time_end.isoformat()
+            self.duration_seconds = self.elapsed_seconds()
+            self.duration_minutes = int(self.duration_seconds // 60)
             self.is_active = False
             logger.info(f"Session ended: {self.session_id}, duration: {self.duration_seconds}s")
     
+    def elapsed_seconds(self) -> float:
+        """Seconds played so far, or the final duration once ended"""
+        if self.is_active and self._monotonic_start is not None:
+            return time.monotonic() - self._monotonic_start
+        return self.duration_seconds
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses"""
         return {
             "session_id": self.session_id,
             "child_profile": self.child_profile,
-            "time_start": self.time_start.isoformat() if self.time_start else None,
-            "time_end": self.time_end.isoformat() if self.time_end else None,
+            "time_start": self._time_start_iso,
+            "time_end": self._time_end_iso,
             "duration_seconds": self.duration_seconds,
-            "duration_minutes": int(self.duration_seconds / 60),
+            "duration_minutes": self.duration_minutes,
             "is_active": self.is_active,
             "metadata": self.metadata
         }
@@ -81,13 +229,32 @@ class SessionRecord:
 class ProcessMonitorService:
     """Main service for monitoring Roblox processes"""
     
+    # Attributes are fixed; a subclass adding state must declare its own __slots__
+    __slots__ = (
+        "is_monitoring", "monitor_task", "_seen_pids", "_roblox_pids", "session_manager",
+        "desktop_service", "config", "_status_cache", "_status_lock", "_proc_cache",
+        "_kill_task", "_exit_watcher", "_exited", "_started", "_wake_event", "_pending_ends",
+        "_proc_watcher"
+    )
+    
     def __init__(self):
         self.is_monitoring = False
         self.monitor_task = None
-        self.known_processes = set()
+        self._seen_pids: Set[int] = set()  # every PID present at the last scan
+        self._roblox_pids: Dict[int, str] = {}  # Roblox PIDs among them -> process name
         self.session_manager = None
         self.desktop_service = None  # Will be injected
         self.config = {}
+        self._status_cache = None  # (monotonic timestamp, process list)
+        self._status_lock = threading.Lock()
+        self._proc_cache: Dict[int, psutil.Process] = {}  # one handle per known Roblox PID
+        self._kill_task: Optional[asyncio.Task] = None  # in-flight force close, shared by concurrent callers
+        self._exit_watcher = None  # per-PID exit notification (pidfd, kqueue or a Windows wait), when available
+        self._exited: List[int] = []  # watched PIDs that exited since the loop last ran
+        self._started: List[tuple] = []  # (pid, name) of Roblox processes reported by _proc_watcher
+        self._wake_event = asyncio.Event()  # wakes _monitor_loop when _exited or _started gains an entry
+        self._proc_watcher = None  # OS process event source, when one is available
+        self._pending_ends: Dict[str, float] = {}  # exited process name -> loop time its session ends
         
     def set_session_manager(self, session_manager):
         """Set the session manager reference"""
@@ -99,9 +266,18 @@ class ProcessMonitorService:
         
     async def start(self):
         """Start the monitoring service"""
-        if not self.is_monitoring:
+        # Guard on the task itself so repeated start calls never spawn a
+        # second loop, while a loop that has died can still be restarted
+        if not self.is_running():
             self.config = load_config()
             self.is_monitoring = True
+            # Subscribe before the initial scan so no launch falls in between
+            if self._proc_watcher is None:
+                self._proc_watcher = start_proc_watcher(
+                    self._on_proc_exec, self._on_proc_exit, is_roblox_process_name
+                )
+            if self._exit_watcher is None:
+                self._exit_watcher = start_exit_watcher(self._on_exit)
             self.monitor_task = asyncio.create_task(self._monitor_loop())
             logger.info("Process monitoring started")
             
@@ -118,6 +294,14 @@ class ProcessMonitorService:
                     await self.monitor_task
                 except asyncio.CancelledError:
                     pass
+            if self._proc_watcher is not None:
+                self._proc_watcher.close()
+                self._proc_watcher = None
+            if self._exit_watcher is not None:
+                self._exit_watcher.close()
+                self._exit_watcher = None
+            # Processes that already exited do not get their relaunch window
+            await self._end_pending_sessions(force=True)
             logger.info("Process monitoring stopped")
     
     def is_running(self) -> bool:
@@ -126,49 +310,183 @@ class ProcessMonitorService:
     
     async def _handle_existing_processes(self):
         """Handle Roblox processes that are already running"""
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if self._is_roblox_process(proc.info['name']):
-                    self.known_processes.add((proc.info['pid'], proc.info['name']))
-                    
-                    if self.config.get("auto_close_roblox", False):
-                        logger.info(f"Auto-closing existing Roblox process: {proc.info['name']} (PID: {proc.info['pid']})")
-                        await self._kill_roblox_processes()
-                        self.known_processes.clear()
-                        break
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        # The first scan sees every PID as new; existing Roblox processes are
+        # recorded as known rather than reported as starts
+        existing, _ = self._scan_pid_changes()
+        if existing and self.config.get("auto_close_roblox", False):
+            # Kill the handles the scan just built rather than scanning again
+            targets = []
+            for pid, name in existing:
+                logger.info(f"Auto-closing existing Roblox process: {name} (PID: {pid})")
+                targets.append((name, self._proc_cache.pop(pid)))
+                self._unwatch_exit(pid)
+            _kill_processes(targets)
+            self._roblox_pids.clear()
+    
+    def _scan_pid_changes(self):
+        """Diff the PID list against the last scan, returning (started, terminated) Roblox processes.
+        
+        Only PIDs that appeared since the last scan have their name looked
+        up, and only Roblox matches get a psutil.Process.
+        """
+        pids = set(psutil.pids())
+        
+        started = []
+        for pid in pids - self._seen_pids:
+            resolved = self._resolve_roblox(pid)
+            if resolved is not None:
+                name, proc = resolved
+                # Keep the handle so status and kill reuse it instead of
+                # rebuilding a Process per call
+                self._proc_cache[pid] = proc
+                self._roblox_pids[pid] = name
+                self._watch_exit(pid)
+                started.append((pid, name))
+        
+        # Only reached for PIDs without an exit watcher (or whose exit the
+        # loop has not drained yet)
+        terminated = [
+            (pid, self._roblox_pids.pop(pid))
+            for pid in self._seen_pids - pids
+            if pid in self._roblox_pids
+        ]
+        for pid, _ in terminated:
+            self._proc_cache.pop(pid, None)
+            self._unwatch_exit(pid)
+        
+        self._seen_pids = pids
+        return started, terminated
+    
+    def _resolve_roblox(self, pid: int, name: Optional[str] = None) -> Optional[Tuple[str, psutil.Process]]:
+        """Return (full name, Process) if pid is a Roblox process, else None.
+        
+        The name check uses read_comm, so a psutil.Process is only built
+        for matches.
+        """
+        if name is None:
+            name = read_comm(pid)
+        if name is None or not is_roblox_process_name(name):
+            return None
+        try:
+            proc = psutil.Process(pid)
+            return proc.name(), proc  # comm is truncated; resolve the full name
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+    
+    def _watch_exit(self, pid: int):
+        """Get notified by the OS when a Roblox process exits"""
+        # Without a watcher, or if pid is already gone, the next PID diff reports the exit
+        if self._exit_watcher is not None:
+            self._exit_watcher.watch(pid)
+    
+    def _unwatch_exit(self, pid: int):
+        if self._exit_watcher is not None:
+            self._exit_watcher.unwatch(pid)
+    
+    def _on_exit(self, pid: int):
+        """A watched Roblox process exited: hand the exit to _monitor_loop"""
+        self._unwatch_exit(pid)
+        self._exited.append(pid)
+        self._wake_event.set()
+    
+    def _on_proc_exec(self, pid: int, name: Optional[str]):
+        """Process event source saw pid exec; record it if it is Roblox"""
+        if pid in self._roblox_pids:
+            return
+        # Already accounted for, so the next PID diff does not look it up again
+        self._seen_pids.add(pid)
+        resolved = self._resolve_roblox(pid, name)
+        if resolved is None:
+            return
+        name, proc = resolved
+        self._proc_cache[pid] = proc
+        self._roblox_pids[pid] = name
+        self._watch_exit(pid)
+        self._started.append((pid, name))
+        self._wake_event.set()
+    
+    def _on_proc_exit(self, pid: int, name: Optional[str]):
+        """Process event source saw pid exit"""
+        if pid in self._roblox_pids:
+            self._on_exit(pid)
+    
+    def _drain_started(self) -> List[tuple]:
+        """Return (pid, name) for Roblox processes reported by the event source"""
+        started, self._started = self._started, []
+        return started
+    
+    def _drain_exited(self) -> List[tuple]:
+        """Return (pid, name) for watched Roblox processes that have exited"""
+        exited, self._exited = self._exited, []
+        terminated = []
+        for pid in exited:
+            name = self._roblox_pids.pop(pid, None)
+            self._proc_cache.pop(pid, None)
+            if name is not None:
+                terminated.append((pid, name))
+        return terminated
     
     async def _monitor_loop(self):
-        """Main monitoring loop"""
+        """Main monitoring loop
+        
+        With a process event source (proc connector on Linux, WMI on
+        Windows) launches are reported as they happen and the PID diff only
+        runs every event_rescan_interval as a safety net for dropped
+        events. Without one, the diff runs every monitor_interval, backing
+        off towards monitor_max_interval while Roblox is absent. Exits of
+        known Roblox processes are reported as soon as the exit watcher
+        fires (pidfd on Linux, kqueue on macOS, a registered wait on Windows).
+        """
+        loop = asyncio.get_running_loop()
+        if self._proc_watcher is not None:
+            base_interval = max_interval = self.config.get("event_rescan_interval", 30)
+        else:
+            base_interval = self.config.get("monitor_interval", 2)
+            max_interval = max(self.config.get("monitor_max_interval", MONITOR_MAX_INTERVAL), base_interval)
+        interval = base_interval
+        next_tick = loop.time()
+        
         while self.is_monitoring:
             try:
-                current_processes = set()
-                
-                # Get current Roblox processes
-                for proc in psutil.process_iter(['pid', 'name']):
-                    try:
-                        if self._is_roblox_process(proc.info['name']):
-                            current_processes.add((proc.info['pid'], proc.info['name']))
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-                
-                # Check for new processes
-                new_processes = current_processes - self.known_processes
-                for pid, name in new_processes:
+                self._wake_event.clear()
+                for pid, name in self._drain_started():
                     await self._handle_process_started(pid, name)
-                
-                # Check for terminated processes
-                terminated_processes = self.known_processes - current_processes
-                for pid, name in terminated_processes:
+                for pid, name in self._drain_exited():
                     await self._handle_process_terminated(pid, name)
+                await self._end_pending_sessions()
                 
-                self.known_processes = current_processes
-                await asyncio.sleep(2)  # Check every 2 seconds
+                if loop.time() >= next_tick:
+                    started, terminated = self._scan_pid_changes()
+                    # While Roblox is absent and nothing changes, stretch
+                    # the interval; any start or close snaps it back
+                    if started or terminated or self._roblox_pids:
+                        interval = base_interval
+                    else:
+                        interval = min(interval * 1.5, max_interval)
+                    
+                    # Check for new processes
+                    for pid, name in started:
+                        await self._handle_process_started(pid, name)
+                    
+                    # Check for terminated processes
+                    for pid, name in terminated:
+                        await self._handle_process_terminated(pid, name)
+                    
+                    # Sleep until a fixed deadline so scan time does not drift the cadence
+                    next_tick = max(next_tick + interval, loop.time())
+                
+                # Woken early when a watched process starts or exits, or a
+                # held-back session end comes due
+                wake_at = min(next_tick, *self._pending_ends.values()) if self._pending_ends else next_tick
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), wake_at - loop.time())
+                except asyncio.TimeoutError:
+                    pass
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
                 await asyncio.sleep(5)
+                next_tick = loop.time()
     
     async def _handle_process_started(self, pid: int, name: str):
         """Handle when a Roblox process starts"""
@@ -184,7 +502,7 @@ class ProcessMonitorService:
         process_info = {
             "pid": pid,
             "name": name,
-            "started_at": datetime.now(timezone.utc).isoformat()
+            "started_at": utc_iso_now()
         }
         
         if self.desktop_service:
@@ -213,6 +531,11 @@ class ProcessMonitorService:
         
         # Start a session if session manager is available
         if self.session_manager:
+            if self._pending_ends.pop(name, None) is not None:
+                logger.info(f"{name} relaunched within {self.config.get('restart_debounce', RESTART_DEBOUNCE)}s - continuing the current session")
+                return
+            # A different executable is starting: settle any held-back end first
+            await self._end_pending_sessions(force=True)
             try:
                 session = await self.session_manager.start_session("default_child")
                 logger.info(f"Started session: {session.session_id}")
@@ -237,50 +560,141 @@ class ProcessMonitorService:
         process_info = {
             "pid": pid,
             "name": name,
-            "terminated_at": datetime.now(timezone.utc).isoformat()
+            "terminated_at": utc_iso_now()
         }
         
         if self.desktop_service:
             await self.desktop_service.send_roblox_event("roblox_stopped", process_info)
         
-        # End session if session manager is available
+        # End session if session manager is available. Held back briefly so
+        # a crash-and-relaunch continues the same session (see _end_pending_sessions)
         if self.session_manager:
+            debounce = self.config.get("restart_debounce", RESTART_DEBOUNCE)
+            self._pending_ends[name] = asyncio.get_running_loop().time() + debounce
+    
+    async def _end_pending_sessions(self, force: bool = False):
+        """End the sessions of exited processes whose relaunch window has passed"""
+        if not self._pending_ends:
+            return
+        now = asyncio.get_running_loop().time()
+        due = [name for name, deadline in self._pending_ends.items() if force or deadline <= now]
+        for name in due:
+            del self._pending_ends[name]
             session = await self.session_manager.end_session("default_child")
             
             # Send session ended event to desktop
             if self.desktop_service and session:
                 await self.desktop_service.send_session_event("session_ended", session.to_dict())
     
-    def _is_roblox_process(self, process_name: str) -> bool:
-        """Check if a process name is a Roblox process"""
-        return (process_name in ROBLOX_PROCESSES or 
-                'roblox' in process_name.lower())
+    async def _kill_roblox_processes(self) -> List[psutil.Process]:
+        """Kill all Roblox processes, returning the processes signalled"""
+        # Handles stay cached until the loop sees the exit, so a kill that
+        # fails leaves the process visible to the next status or close
+        return _kill_processes(self._live_roblox_processes())
     
-    async def _kill_roblox_processes(self):
-        """Kill all Roblox processes"""
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if self._is_roblox_process(proc.info['name']):
-                    logger.info(f"Killing process: {proc.info['name']} (PID: {proc.info['pid']})")
-                    proc.kill()
-            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                logger.warning(f"Could not kill process: {e}")
+    def _live_roblox_processes(self) -> List[Tuple[str, psutil.Process]]:
+        """Return (name, Process) for every Roblox process running now.
+        
+        While the monitor loop is keeping the PID diff, this reuses its
+        cached handles and only looks up PIDs that appeared since the last
+        tick; otherwise it falls back to a full process-table scan.
+        
+        Runs in worker threads as well as on the loop, so it never adds or
+        removes cache entries; only the loop's exit and diff paths do.
+        """
+        if not self.is_running():
+            # Nothing would evict handles cached here, so build fresh ones
+            found = []
+            for pid, name in iter_process_names():
+                if not is_roblox_process_name(name):
+                    continue
+                try:
+                    proc = psutil.Process(pid)
+                    found.append((proc.name(), proc))
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return found
+        
+        pids = set(psutil.pids())
+        # Snapshots, seen PIDs first: the event loop records a launch in
+        # _seen_pids and _roblox_pids while status requests run in worker
+        # threads, and taken in this order a launch lands in at least one
+        unseen = pids - self._seen_pids
+        known = list(self._roblox_pids.items())
+        found = {}
+        for pid, name in known:
+            if pid not in pids:
+                continue
+            proc = self._proc_cache.get(pid)
+            if proc is None:
+                # Known but without a handle, usually because the loop is
+                # evicting it right now: use an uncached one rather than lose
+                # the process, provided the PID still names Roblox
+                if not is_roblox_process_name(read_comm(pid) or ""):
+                    continue
+                try:
+                    proc = psutil.Process(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            elif not proc.is_running():
+                continue  # is_running() compares create_time, so a reused PID is skipped
+            found[pid] = (name, proc)
+        for pid in unseen - found.keys():
+            resolved = self._resolve_roblox(pid)
+            if resolved is not None:
+                found[pid] = resolved
+        return list(found.values())
+    
+    async def _wait_for_exit(self, procs: List[psutil.Process], timeout: float = KILL_WAIT_TIMEOUT):
+        """Wait for processes to exit without sleep-polling"""
+        if not procs:
+            return
+        
+        if not hasattr(os, "pidfd_open"):
+            # No pidfd support (non-Linux or kernel < 5.3): let psutil poll off the loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, psutil.wait_procs, procs, timeout)
+            return
+        
+        loop = asyncio.get_running_loop()
+        waiters = []
+        fds = []
+        
+        def on_exit(fd, waiter):
+            loop.remove_reader(fd)
+            if not waiter.done():
+                waiter.set_result(None)
+        
+        try:
+            for proc in procs:
+                try:
+                    fd = os.pidfd_open(proc.pid)
+                except OSError:
+                    continue  # Already gone
+                fds.append(fd)
+                # Guard against the PID having been reused before we opened it
+                if not proc.is_running():
+                    continue
+                waiter = loop.create_future()
+                loop.add_reader(fd, on_exit, fd, waiter)
+                waiters.append(waiter)
+            
+            if waiters:
+                await asyncio.wait(waiters, timeout=timeout)
+        finally:
+            for fd in fds:
+                loop.remove_reader(fd)
+                os.close(fd)
     
     def get_roblox_status(self) -> Dict[str, Any]:
         """Get current Roblox process status"""
-        processes = []
-        
-        for proc in psutil.process_iter(['pid', 'name', 'create_time']):
-            try:
-                if self._is_roblox_process(proc.info['name']):
-                    processes.append({
-                        "pid": proc.info['pid'],
-                        "name": proc.info['name'],
-                        "started_at": datetime.fromtimestamp(proc.info['create_time']).isoformat(),
-                        "memory_usage": proc.memory_info().rss if hasattr(proc, 'memory_info') else 0
-                    })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        # Concurrent pollers within the TTL share a single process-table scan
+        with self._status_lock:
+            cached = self._status_cache
+            if cached is None or time.monotonic() - cached[0] >= STATUS_CACHE_TTL:
+                cached = (time.monotonic(), self._scan_roblox_processes())
+                self._status_cache = cached
+        processes = cached[1]
         
         return {
             "is_running": len(processes) > 0,
@@ -289,24 +703,79 @@ class ProcessMonitorService:
             "monitoring_active": self.is_running()
         }
     
+    def _scan_roblox_processes(self) -> List[Dict[str, Any]]:
+        """Collect details for all running Roblox processes"""
+        return list(self._iter_roblox_processes())
+    
+    def _iter_roblox_processes(self) -> Iterator[Dict[str, Any]]:
+        """Yield details for each running Roblox process as it is found"""
+        for name, proc in self._live_roblox_processes():
+            try:
+                # oneshot() lets psutil serve both reads from one fetch of
+                # the process info where the platform allows it
+                with proc.oneshot():
+                    info = {
+                        "pid": proc.pid,
+                        "name": name,
+                        "started_at": datetime.fromtimestamp(proc.create_time(), tz=timezone.utc).isoformat(),
+                        "memory_usage": proc.memory_info().rss
+                    }
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            yield info
+    
     def get_process_info(self) -> Dict[str, Any]:
         """Get detailed Roblox process information"""
         return self.get_roblox_status()
     
+    def iter_process_info(self) -> Iterator[Dict[str, Any]]:
+        """Yield Roblox process details one at a time.
+        
+        Serves from the status cache while it is fresh; otherwise scans
+        lazily so callers can stream records without building the list.
+        """
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            yield from cached[1]
+        else:
+            yield from self._iter_roblox_processes()
+    
     async def force_close_roblox(self, reason: str = "Parent control"):
-        """Force close all Roblox processes"""
+        """Force close all Roblox processes
+        
+        Calls that arrive while a close is already in flight wait on that
+        close instead of scanning and killing again.
+        """
+        if self._kill_task is None:
+            self._kill_task = asyncio.create_task(self._do_force_close(reason))
+            self._kill_task.add_done_callback(self._clear_kill_task)
+        else:
+            logger.info("Force close already in progress - Reason: %s", reason)
+        # Shielded so one caller going away does not cancel the others' close
+        return await asyncio.shield(self._kill_task)
+    
+    def _clear_kill_task(self, task: asyncio.Task):
+        if self._kill_task is task:
+            self._kill_task = None
+    
+    async def _do_force_close(self, reason: str) -> bool:
         logger.info(f"Force closing Roblox - Reason: {reason}")
-        await self._kill_roblox_processes()
+        killed = await self._kill_roblox_processes()
+        await self._wait_for_exit(killed)
+        self._status_cache = None
         return True
 
 class SessionManager:
     """Manages gaming sessions for different child profiles"""
     
-    def __init__(self):
+    __slots__ = ("active_sessions", "session_history", "time_limits", "desktop_service", "_live_cache")
+    
+    def __init__(self, history_max: int = SESSION_HISTORY_MAX):
         self.active_sessions: Dict[str, SessionRecord] = {}
-        self.session_history: List[SessionRecord] = []
+        self.session_history: deque = deque(maxlen=history_max)  # oldest records drop off
         self.time_limits: Dict[str, int] = {}  # minutes per child
         self.desktop_service = None  # Will be set later
+        self._live_cache: Dict[str, tuple] = {}  # child_profile -> (monotonic timestamp, payload)
         
     def set_desktop_service(self, desktop_service):
         """Set the desktop client service reference"""
@@ -321,6 +790,7 @@ class SessionManager:
         session = SessionRecord(child_profile)
         session.start()
         self.active_sessions[child_profile] = session
+        self._live_cache.pop(child_profile, None)
         
         # Send session start notification to desktop client
         if self.desktop_service:
@@ -345,6 +815,7 @@ class SessionManager:
             # Move to history
             self.session_history.append(session)
             del self.active_sessions[child_profile]
+            self._live_cache.pop(child_profile, None)
             
             # Send session end notification to desktop client
             if self.desktop_service:
@@ -363,12 +834,17 @@ class SessionManager:
     
     def get_live_session(self, child_profile: str) -> Optional[Dict[str, Any]]:
         """Get the current live session for a child"""
-        if child_profile in self.active_sessions:
-            session_data = self.active_sessions[child_profile].to_dict()
+        now = time.monotonic()
+        cached = self._live_cache.get(child_profile)
+        if cached and now - cached[0] < LIVE_SESSION_CACHE_TTL:
+            return cached[1]
+        
+        session = self.active_sessions.get(child_profile)
+        if session:
+            session_data = session.to_dict()
             # Update current duration
-            session_data['current_duration_seconds'] = (
-                datetime.now(timezone.utc) - self.active_sessions[child_profile].time_start
-            ).total_seconds()
+            session_data['current_duration_seconds'] = session.elapsed_seconds()
+            self._live_cache[child_profile] = (now, session_data)
             return session_data
         return None
     
@@ -379,12 +855,10 @@ class SessionManager:
         
         # Notify desktop client of time limit change
         if self.desktop_service:
-            asyncio.create_task(
-                self.desktop_service.send_notification_to_desktop(
-                    "Time Limit Updated",
-                    f"Time limit for {child_profile} set to {limit_minutes} minutes",
-                    "time_limit_update"
-                )
+            self.desktop_service.enqueue_notification(
+                "Time Limit Updated",
+                f"Time limit for {child_profile} set to {limit_minutes} minutes",
+                "time_limit_update"
             )
     
     async def check_time_limits(self) -> List[str]:
@@ -394,7 +868,7 @@ class SessionManager:
         for child_profile, session in self.active_sessions.items():
             if child_profile in self.time_limits:
                 limit_seconds = self.time_limits[child_profile] * 60
-                current_duration = (datetime.now(timezone.utc) - session.time_start).total_seconds()
+                current_duration = session.elapsed_seconds()
                 
                 if current_duration > limit_seconds:
                     exceeded_profiles.append(child_profile)
@@ -409,11 +883,54 @@ class SessionManager:
         
         return exceeded_profiles
 
+def _applescript_string(text: str) -> str:
+    """Quote text as a one-line AppleScript string literal"""
+    text = text.replace("\\", "\\\\").replace('"', '\\"')
+    return '"' + text.replace("\r", " ").replace("\n", " ") + '"'
+
+def _notify_message(title: str, message: str):
+    """Build an org.freedesktop.Notifications.Notify call that expects no reply"""
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.low_level import HeaderFlags
+    address = DBusAddress(
+        "/org/freedesktop/Notifications",
+        bus_name="org.freedesktop.Notifications",
+        interface="org.freedesktop.Notifications"
+    )
+    msg = new_method_call(address, "Notify", "susssasa{sv}i",
+                          ("Roblox Monitor", 0, "", title, message, [], {}, -1))
+    # Nothing reads replies on this connection, so do not ask for one
+    msg.header.flags |= HeaderFlags.NO_REPLY_EXPECTED
+    return msg
+
 class NotificationService:
     """Service for sending notifications"""
     
-    def __init__(self):
-        self.notification_history = []
+    def __init__(self, history_max: int = SESSION_HISTORY_MAX):
+        self.notification_history: deque = deque(maxlen=history_max)  # oldest entries drop off
+        # Notification backends are started on first use and kept for later
+        # notifications instead of spawning a process per message
+        self._ns_center = None  # NSUserNotificationCenter via pyobjc; False once unavailable
+        self._osascript: Optional[subprocess.Popen] = None
+        self._dbus = None  # jeepney session-bus connection; False once unavailable
+        # The platform cannot change while running, so pick the sender once
+        self._send_native = {
+            "Windows": self._send_windows_notification,
+            "Darwin": self._send_macos_notification
+        }.get(platform.system(), self._send_linux_notification)
+    
+    def close(self):
+        """Shut down the persistent notification helpers"""
+        if self._osascript is not None:
+            try:
+                self._osascript.stdin.close()
+            except OSError:
+                pass
+            self._osascript.wait()
+            self._osascript = None
+        if self._dbus:
+            self._dbus.close()
+            self._dbus = None
     
     async def send_desktop_notification(self, title: str, message: str) -> bool:
         """Send a desktop notification"""
@@ -421,18 +938,13 @@ class NotificationService:
             notification_data = {
                 "title": title,
                 "message": message,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": utc_iso_now()
             }
             
             self.notification_history.append(notification_data)
             
             # Try to send system notification
-            if platform.system() == "Windows":
-                await self._send_windows_notification(title, message)
-            elif platform.system() == "Darwin":  # macOS
-                await self._send_macos_notification(title, message)
-            else:  # Linux
-                await self._send_linux_notification(title, message)
+            await self._send_native(title, message)
             
             logger.info(f"Sent notification: {title} - {message}")
             return True
@@ -446,45 +958,161 @@ class NotificationService:
         try:
             import win10toast
             toaster = win10toast.ToastNotifier()
-            toaster.show_toast(title, message, duration=10)
+            # threaded: show_toast otherwise blocks for the whole duration
+            toaster.show_toast(title, message, duration=10, threaded=True)
         except ImportError:
             logger.warning("win10toast not available, using print fallback")
             print(f"🚨 NOTIFICATION: {title} - {message}")
     
     async def _send_macos_notification(self, title: str, message: str):
         """Send macOS notification"""
-        try:
-            subprocess.run([
-                "osascript", "-e", 
-                f'display notification "{message}" with title "{title}"'
-            ])
-        except Exception:
-            print(f"🚨 NOTIFICATION: {title} - {message}")
+        if self._ns_center is None:
+            self._ns_center = self._open_ns_center()
+        if self._ns_center:
+            # Delivered in-process: no osascript and no string escaping
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._deliver_ns_notification, title, message)
+            return
+        
+        script = f'display notification {_applescript_string(message)} with title {_applescript_string(title)}\n'
+        # Retry once with a fresh helper if the previous one has died
+        for _ in range(2):
+            try:
+                if self._osascript is None or self._osascript.poll() is not None:
+                    # Interactive mode runs each line as it arrives
+                    self._osascript = subprocess.Popen(
+                        ["osascript", "-i"],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        text=True
+                    )
+                self._osascript.stdin.write(script)
+                self._osascript.stdin.flush()
+                return
+            except (BrokenPipeError, ValueError):
+                self._osascript = None
+            except Exception:
+                break
+        print(f"🚨 NOTIFICATION: {title} - {message}")
     
     async def _send_linux_notification(self, title: str, message: str):
         """Send Linux notification"""
+        if self._dbus is None:
+            self._dbus = self._open_dbus()
+        if self._dbus:
+            try:
+                self._dbus.send(_notify_message(title, message))
+                return
+            except Exception as e:
+                logger.warning(f"D-Bus notification failed, falling back to notify-send: {e}")
+                self._dbus.close()
+                self._dbus = None
         try:
-            subprocess.run(["notify-send", title, message])
+            # Spawned and reaped by the event loop instead of blocking it
+            proc = await asyncio.create_subprocess_exec(
+                "notify-send", title, message,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            await proc.wait()
         except Exception:
             print(f"🚨 NOTIFICATION: {title} - {message}")
+    
+    def _open_ns_center(self):
+        """Return the user notification center, or False without pyobjc"""
+        try:
+            from Foundation import NSUserNotificationCenter
+        except ImportError:
+            logger.info("pyobjc not available, using osascript for notifications")
+            return False
+        # nil when the interpreter is not running from an app bundle
+        center = NSUserNotificationCenter.defaultUserNotificationCenter()
+        if center is None:
+            logger.info("No user notification center for this process, using osascript for notifications")
+            return False
+        return center
+    
+    def _deliver_ns_notification(self, title: str, message: str):
+        from Foundation import NSUserNotification
+        notification = NSUserNotification.alloc().init()
+        notification.setTitle_(title)
+        notification.setInformativeText_(message)
+        self._ns_center.deliverNotification_(notification)
+    
+    def _open_dbus(self):
+        """Connect to the session bus once, or return False if that is not possible"""
+        try:
+            from jeepney.io.blocking import open_dbus_connection
+            return open_dbus_connection(bus="SESSION")
+        except ImportError:
+            logger.info("jeepney not available, using notify-send for notifications")
+        except Exception as e:
+            logger.info(f"No D-Bus session bus, using notify-send for notifications: {e}")
+        return False
 
 class SystemInfoService:
     """Service for retrieving system information"""
     
+    def __init__(self):
+        # Boot time and the host description never change while we run, so
+        # gather them once
+        self.boot_time = datetime.fromtimestamp(psutil.boot_time(), tz=timezone.utc).isoformat()
+        self.host_info = {
+            "platform": platform.platform(),
+            "system": platform.system(),
+            "processor": platform.processor(),
+            "architecture": platform.architecture(),
+            "python_version": platform.python_version(),
+            "cpu_count": psutil.cpu_count()
+        }
+        # The first non-blocking reading only sets psutil's baseline
+        psutil.cpu_percent(interval=None)
+        self.cpu_percent = 0.0
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._info_cache = None  # (monotonic timestamp, system info)
+    
+    async def start(self):
+        """Start refreshing the CPU reading in the background"""
+        if self._sampler_task is None:
+            self._sampler_task = asyncio.create_task(self._sample_cpu())
+    
+    async def stop(self):
+        """Stop the CPU sampler"""
+        if self._sampler_task:
+            self._sampler_task.cancel()
+            try:
+                await self._sampler_task
+            except asyncio.CancelledError:
+                pass
+            self._sampler_task = None
+    
+    async def _sample_cpu(self):
+        while True:
+            await asyncio.sleep(CPU_SAMPLE_INTERVAL)
+            # Utilisation since the previous sample; never blocks
+            self.cpu_percent = psutil.cpu_percent(interval=None)
+    
     def get_system_info(self) -> Dict[str, Any]:
-        """Get comprehensive system information"""
+        """Get comprehensive system information
+        
+        Repeated polls within SYSTEM_INFO_CACHE_TTL share one reading; the
+        returned dict is shared, so treat it as read-only.
+        """
+        cached = self._info_cache
+        if cached is not None and time.monotonic() - cached[0] < SYSTEM_INFO_CACHE_TTL:
+            return cached[1]
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            if self._sampler_task is not None:
+                cpu_percent = self.cpu_percent
+            else:
+                # No sampler running: utilisation since the previous call
+                cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
-            return {
-                "platform": platform.platform(),
-                "system": platform.system(),
-                "processor": platform.processor(),
-                "architecture": platform.architecture(),
-                "python_version": platform.python_version(),
-                "cpu_count": psutil.cpu_count(),
+            info = {
+                **self.host_info,
                 "cpu_percent": cpu_percent,
                 "memory": {
                     "total": memory.total,
@@ -498,9 +1126,11 @@ class SystemInfoService:
                     "free": disk.free,
                     "percent": (disk.used / disk.total) * 100
                 },
-                "boot_time": datetime.fromtimestamp(psutil.boot_time()).isoformat(),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "boot_time": self.boot_time,
+                "timestamp": utc_iso_now()
             }
+            self._info_cache = (time.monotonic(), info)
+            return info
         except Exception as e:
             logger.error(f"Error getting system info: {e}")
             return {"error": str(e)}
@@ -509,12 +1139,28 @@ class SystemInfoService:
 class DesktopClientService:
     """Service for communicating with Flutter desktop client"""
     
-    def __init__(self):
+    # detach() swaps queues by attribute name, so every queue must be listed here
+    __slots__ = (
+        "desktop_client_connected", "session_data_queue", "notification_queue", "event_queue",
+        "_queued_notifications", "websocket_server", "_swap_lock", "event_queue_notify",
+        "_tx_buffer", "_tx_full", "_flush_task", "_flush_delay", "_queue_max"
+    )
+    
+    def __init__(self, queue_max: int = DESKTOP_QUEUE_MAX):
         self.desktop_client_connected = False
-        self.session_data_queue = []
-        self.notification_queue = []
-        self.event_queue = []  # New: Queue for events to send to desktop
+        self._queue_max = queue_max  # cap on each queue; every swapped-in queue gets it too
+        self.session_data_queue = deque(maxlen=queue_max)
+        self.notification_queue = deque(maxlen=queue_max)
+        self.event_queue = deque(maxlen=queue_max)  # New: Queue for events to send to desktop
+        # (title, message, type) -> the notification event already in event_queue
+        self._queued_notifications: Dict[tuple, Dict[str, Any]] = {}
         self.websocket_server = None
+        self._swap_lock = asyncio.Lock()
+        self.event_queue_notify = asyncio.Event()  # Set whenever event_queue gains items
+        self._tx_buffer: List[Dict[str, Any]] = []  # WebSocket messages awaiting the next flush
+        self._tx_full = asyncio.Event()  # Set when _tx_buffer reaches DESKTOP_BATCH_MAX
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_delay = DESKTOP_FLUSH_DELAY
         
     async def init_websocket_server(self):
         """Initialize WebSocket server for real-time communication"""
@@ -540,60 +1186,169 @@ class DesktopClientService:
     
     async def _process_queued_data(self):
         """Process any queued session data or notifications"""
+        # Detach the queues up front so anything re-queued while sending
+        # lands in the fresh queues instead of the ones being iterated
+        sessions = await self.drain("session_data_queue")
+        notifications = await self.drain("notification_queue")
+        events = await self.drain("event_queue")
+        
         # Process session data queue
-        for session_data in self.session_data_queue:
+        for session_data in sessions:
             logger.info(f"Sending queued session data to desktop client: {session_data['session_id']}")
             await self._send_via_available_channel("session_data", session_data)
         
         # Process notification queue  
-        for notification in self.notification_queue:
+        for notification in notifications:
             logger.info(f"Sending queued notification to desktop client: {notification['title']}")
             await self._send_via_available_channel("notification", notification)
         
-        # Process event queue
-        for event in self.event_queue:
+        # Process event queue. Its entries are already {type, data, timestamp}
+        # envelopes, so they are sent under their own type, or put back as
+        # they were while no WebSocket client is attached
+        if events and not (self.websocket_server and self.websocket_server.has_connected_clients()):
+            self.event_queue.extendleft(reversed(events))
+            self.event_queue_notify.set()
+            return
+        for event in events:
             logger.info(f"Sending queued event to desktop client: {event['type']}")
-            await self._send_via_available_channel("event", event)
-        
-        # Clear queues
-        self.session_data_queue.clear()
-        self.notification_queue.clear()
-        self.event_queue.clear()
+            await self._send_via_available_channel(event["type"], event["data"])
+    
+    async def detach(self, queue_name: str) -> deque:
+        """Detach the named queue, swapping in an empty one"""
+        async with self._swap_lock:
+            old = getattr(self, queue_name)
+            setattr(self, queue_name, deque(maxlen=self._queue_max))
+            if queue_name == "event_queue":
+                self._queued_notifications = {}
+        return old
+    
+    async def drain(self, queue_name: str) -> List[Dict[str, Any]]:
+        """Detach the named queue and return its items as a list"""
+        return list(await self.detach(queue_name))
     
     async def _send_via_available_channel(self, message_type: str, data: Dict[str, Any]):
         """Send data via WebSocket if available, otherwise queue"""
-        logger.info(f"Attempting to send {message_type} via available channel")
+        return self._enqueue(message_type, data)
+    
+    def _enqueue(self, message_type: str, data: Dict[str, Any]) -> bool:
+        """Buffer a message for the next WebSocket flush, or queue it for polling.
         
-        # Try WebSocket first (real-time)
+        Never awaits, so synchronous callers can use it; returns True when
+        the message is headed for the WebSocket.
+        """
+        # Try WebSocket first (real-time). Messages are buffered and sent
+        # together by _flush_soon so a burst of events costs one frame.
         if self.websocket_server and self.websocket_server.has_connected_clients():
-            try:
-                await self.websocket_server.send_to_desktop(message_type, data)
-                logger.info(f"Successfully sent {message_type} via WebSocket")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to send {message_type} via WebSocket: {e}")
+            self._tx_buffer.append({
+                "type": message_type,
+                "data": data,
+                "timestamp": utc_iso_now()
+            })
+            if len(self._tx_buffer) >= DESKTOP_BATCH_MAX:
+                self._tx_full.set()
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_soon())
+            return True
+        
+        if not self.websocket_server:
+            logger.info("WebSocket server not available")
         else:
-            if not self.websocket_server:
-                logger.info("WebSocket server not available")
-            elif not self.websocket_server.has_connected_clients():
-                logger.info("No WebSocket clients connected")
+            logger.info("No WebSocket clients connected")
         
         # Fall back to HTTP polling queue
+        self._queue_for_polling(message_type, data)
+        return False
+    
+    async def _flush_soon(self):
+        """Wait out the coalescing window, then send _tx_buffer as one frame"""
+        try:
+            await asyncio.wait_for(self._tx_full.wait(), self._flush_delay)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._flush_task = None
+        await self.flush()
+    
+    async def flush(self):
+        """Send every buffered WebSocket message now"""
+        items, self._tx_buffer = self._tx_buffer, []
+        self._tx_full.clear()
+        if not items:
+            return
+        
+        # Sends that never yield can overfill the buffer before this runs,
+        # so it goes out in slices of at most DESKTOP_BATCH_MAX
+        for start in range(0, len(items), DESKTOP_BATCH_MAX):
+            await self._send_batch(items[start:start + DESKTOP_BATCH_MAX])
+    
+    async def _send_batch(self, items: List[Dict[str, Any]]):
+        """Send buffered messages as one frame, or queue them for polling when no client gets it"""
+        # The last client may have left since _enqueue buffered these
+        if not self.websocket_server.has_connected_clients():
+            logger.info("No WebSocket clients connected")
+            self._requeue_for_polling(items)
+            return
+        
+        # A lone message keeps its own type so single events look the same
+        # to the desktop client as they did before batching
+        if len(items) == 1:
+            message_type, payload = items[0]["type"], items[0]["data"]
+        else:
+            message_type, payload = "batch", items
+        # Clients whose send fails are dropped by the server, so only a frame
+        # that reached nobody is re-queued and none is received twice
+        if await self.websocket_server.send_to_desktop(message_type, payload):
+            logger.info("Sent %d message(s) via WebSocket", len(items))
+        else:
+            logger.warning("No WebSocket client received %d message(s)", len(items))
+            self._requeue_for_polling(items)
+    
+    def _requeue_for_polling(self, items: List[Dict[str, Any]]):
+        """Queue buffered WebSocket messages for HTTP polling instead"""
+        for item in items:
+            self._queue_for_polling(item["type"], item["data"])
+    
+    def _queue_for_polling(self, message_type: str, data: Dict[str, Any]):
+        """Queue a message for the desktop client's HTTP polling
+        
+        A notification identical to one still waiting is folded into it,
+        counting repeats in data["count"], instead of being queued again.
+        """
+        key = None
+        if message_type == "notification":
+            key = (data.get("title"), data.get("message"), data.get("type"))
+            queued = self._queued_notifications.get(key)
+            if queued is not None:
+                queued["data"]["count"] = queued["data"].get("count", 1) + 1
+                queued["data"]["timestamp"] = data.get("timestamp")
+                queued["timestamp"] = utc_iso_now()
+                return
+        
+        if len(self.event_queue) == self.event_queue.maxlen:
+            # The append below evicts the oldest event
+            evicted = self.event_queue[0]
+            if evicted["type"] == "notification":
+                self._queued_notifications.pop(
+                    (evicted["data"].get("title"), evicted["data"].get("message"), evicted["data"].get("type")), None
+                )
+        
         event_data = {
             "type": message_type,
             "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_iso_now()
         }
         self.event_queue.append(event_data)
+        if key is not None:
+            self._queued_notifications[key] = event_data
+        self.event_queue_notify.set()
         logger.info(f"Queued {message_type} for HTTP polling (queue size: {len(self.event_queue)})")
-        return False
     
     async def send_roblox_event(self, event_type: str, process_info: Dict[str, Any]):
         """Send Roblox process events (started/stopped) to desktop client"""
         event_data = {
             "event_type": event_type,  # "roblox_started" or "roblox_stopped"
             "process_info": process_info,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_iso_now()
         }
         
         await self._send_via_available_channel("roblox_event", event_data)
@@ -604,7 +1359,7 @@ class DesktopClientService:
         event_data = {
             "event_type": event_type,  # "session_started", "session_ended", "time_limit_warning"
             "session_data": session_data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_iso_now()
         }
         
         await self._send_via_available_channel("session_event", event_data)
@@ -616,14 +1371,18 @@ class DesktopClientService:
     
     async def send_notification_to_desktop(self, title: str, message: str, notification_type: str = "info") -> bool:
         """Send notification to desktop client"""
+        return self.enqueue_notification(title, message, notification_type)
+    
+    def enqueue_notification(self, title: str, message: str, notification_type: str = "info") -> bool:
+        """Synchronous form of send_notification_to_desktop; must run on the event loop"""
         notification_data = {
             "title": title,
             "message": message, 
             "type": notification_type,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_iso_now()
         }
         
-        return await self._send_via_available_channel("notification", notification_data)
+        return self._enqueue("notification", notification_data)
     
     async def request_firebase_sync(self, data: Dict[str, Any], data_type: str = "session") -> bool:
         """Request desktop client to sync data to Firebase"""
@@ -631,25 +1390,39 @@ class DesktopClientService:
             "type": "firebase_sync",
             "data_type": data_type,
             "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_iso_now()
         }
         
         return await self._send_via_available_channel("firebase_sync_request", sync_request)
     
-    def get_pending_events(self) -> List[Dict[str, Any]]:
-        """Get all pending events for HTTP polling (desktop client calls this)"""
-        events = self.event_queue.copy()
-        self.event_queue.clear()  # Clear after retrieval
+    def get_pending_events(self) -> deque:
+        """Get all pending events for HTTP polling (desktop client calls this)
+        
+        Swaps in an empty queue rather than copying and clearing, so an
+        event appended in between cannot be lost. Call from the event loop,
+        where events are produced.
+        """
+        events, self.event_queue = self.event_queue, deque(maxlen=self._queue_max)
+        self._queued_notifications = {}
         return events
 
 # Utility functions
+CONFIG_PATH = Path("config.json")
+
+# (st_mtime_ns, st_size, parsed config) from the last read of CONFIG_PATH
+_config_cache: Optional[tuple] = None
+
 def load_config() -> dict:
-    """Load configuration from config.json"""
-    config_file = Path("config.json")
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            return json.load(f)
-    else:
+    """Load configuration from config.json
+    
+    The file is only re-read when its mtime or size changes. The returned
+    dict is shared between callers, so treat it as read-only and write
+    changes back with save_config.
+    """
+    global _config_cache
+    try:
+        st = CONFIG_PATH.stat()
+    except FileNotFoundError:
         # Return default config
         default_config = {
             "auto_close_roblox": False,
@@ -658,14 +1431,34 @@ def load_config() -> dict:
             "time_limits": {}
         }
         # Save default config
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        save_config(default_config)
         return default_config
+    
+    cached = _config_cache
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    config = orjson.loads(CONFIG_PATH.read_bytes())
+    _config_cache = (st.st_mtime_ns, st.st_size, config)
+    return config
+
+def get_unix_socket_path(config: dict) -> Optional[str]:
+    """Return the UNIX socket path for the local desktop client, if enabled"""
+    unix_socket = config.get("desktop_client", {}).get("unix_socket", {})
+    if unix_socket.get("enabled", False) and hasattr(socket, "AF_UNIX"):
+        return unix_socket.get("path", "/tmp/robloxlog.sock")
+    return None
 
 def save_config(config: dict):
     """Save configuration to config.json"""
-    with open("config.json", 'w') as f:
-        json.dump(config, f, indent=4)
+    global _config_cache
+    CONFIG_PATH.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    # Seed the cache with what was just written so the next load_config
+    # does not read it back; an unreadable stat just leaves it cold
+    try:
+        st = CONFIG_PATH.stat()
+        _config_cache = (st.st_mtime_ns, st.st_size, config)
+    except OSError:
+        _config_cache = None
     logger.info("Configuration saved")
 
 # Compatibility functions for existing code
@@ -673,24 +1466,23 @@ async def simple_polling_monitor():
     """Legacy function for backward compatibility"""
     monitor = ProcessMonitorService()
     await monitor.start()
-    while True:
-        await asyncio.sleep(1)
+    await monitor.monitor_task
 
 def check_current_processes():
     """Legacy function for backward compatibility"""
     processes = []
-    for proc in psutil.process_iter(['pid', 'name']):
+    for pid, name in iter_process_names():
+        if not is_roblox_process_name(name):
+            continue
         try:
-            if 'roblox' in proc.info['name'].lower():
-                processes.append({
-                    "pid": proc.info['pid'],
-                    "name": proc.info['name']
-                })
+            processes.append({
+                "pid": pid,
+                "name": psutil.Process(pid).name()
+            })
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
     return processes
 
 async def kill_roblox_processes():
     """Legacy function for backward compatibility"""
-    monitor = ProcessMonitorService()
-    await monitor._kill_roblox_processes()
+    await _kill_all_roblox_processes()
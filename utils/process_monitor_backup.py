@@ -1,97 +1,235 @@
 import psutil
 import time
 import asyncio
-import json
+import functools
+import orjson
+import sys
 from record import Record
+from utils.process_monitor import MONITOR_MAX_INTERVAL, iter_process_names
+from utils.proc_events import WmiProcWatcher
 
-ROBLOX_PROCESSES = [
+ROBLOX_PROCESSES = frozenset((
     "RobloxPlayerBeta.exe",
     "RobloxStudioBeta.exe",
     "RobloxPlayerLauncher.exe",
     "Roblox"
-]
+))
 
+# Linux truncates /proc/<pid>/comm names to 15 characters
+_COMM_LEN = 15
+_ROBLOX_COMM = frozenset(name[:_COMM_LEN] for name in ROBLOX_PROCESSES)
+_LINUX = sys.platform.startswith("linux")
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
-    with open('config.json', 'r') as f:
-        return json.load(f)
+    """Read config.json once; call load_config.cache_clear() to pick up edits"""
+    with open('config.json', 'rb') as f:
+        return orjson.loads(f.read())
+
+def _listed_name(pid):
+    """Name of pid as cheaply as the platform allows (truncated comm on Linux)"""
+    if _LINUX:
+        with open(f"/proc/{pid}/comm", "rb") as f:
+            return f.read().rstrip(b"\n").decode(errors="replace")
+    return psutil.Process(pid).name()
+
+def _roblox_name(pid, name):
+    """Full Roblox process name for pid from its listed name, or None if it is not Roblox"""
+    if name in ROBLOX_PROCESSES:
+        return name
+    if name in _ROBLOX_COMM:
+        # Truncated comm: resolve the full name for this candidate only
+        full_name = psutil.Process(pid).name()
+        return full_name if full_name in ROBLOX_PROCESSES else None
+    return None
 
 def check_current_processes():
     """Debug function to see what processes are currently running"""
-    print("Current running processes containing 'roblox' or 'dart':")
-    for proc in psutil.process_iter(['pid', 'name']):
+    print("Current running Roblox processes:")
+    for pid, name in iter_process_names():
         try:
-            proc_name = proc.info['name'].lower()
-            if 'roblox' in proc_name:
-                print(f"  Found: {proc.info['name']} (PID: {proc.info['pid']})")
+            name = _roblox_name(pid, name)
+            if name is not None:
+                print(f"  Found: {name} (PID: {pid})")
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
 
-async def kill_roblox_processes():
-    """Kill all Roblox processes"""
-    for proc in psutil.process_iter(['pid', 'name']):
+# How long kill_roblox_processes waits for killed processes to exit
+KILL_WAIT_TIMEOUT = 3  # seconds
+
+def _find_roblox_processes():
+    """Process handles for every running Roblox process"""
+    targets = []
+    for pid, name in iter_process_names():
         try:
-            proc_name = proc.info['name'].lower()
-            if 'roblox' in proc_name:
-                print(f"Killing process: {proc.info['name']} (PID: {proc.info['pid']})")
-                proc.kill()
+            name = _roblox_name(pid, name)
+            if name is not None:
+                targets.append(psutil.Process(pid))
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
+    return targets
+
+def _kill(proc):
+    try:
+        print(f"Killing process: {proc.name()} (PID: {proc.pid})")
+        proc.kill()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+async def kill_roblox_processes():
+    """Kill all Roblox processes and wait for them to exit.
+
+    The process scan, the kills and the exit wait all run in worker threads,
+    with the kills issued concurrently, so the event loop is never blocked.
+    """
+    targets = await asyncio.to_thread(_find_roblox_processes)
+    if not targets:
+        return
+    await asyncio.gather(*(asyncio.to_thread(_kill, proc) for proc in targets))
+    _, alive = await asyncio.to_thread(psutil.wait_procs, targets, timeout=KILL_WAIT_TIMEOUT)
+    for proc in alive:
+        print(f"Process still running after kill: PID {proc.pid}")
+
+class _RobloxPidTracker:
+    """Tracks Roblox PIDs between polls without rebuilding per-poll collections.
+
+    known maps every PID already looked at to its Roblox process name, or
+    None when it is some other process, so only PIDs that appeared since the
+    last poll are ever looked up, and psutil is only used for Roblox
+    candidates on Linux. The current-PID set is reused across polls.
+    """
+
+    def __init__(self):
+        self.known = {}
+        self.roblox_count = 0  # entries in known that are Roblox processes
+        self._current = set()
+
+    def diff(self):
+        """Update from the current PID list and return (started, terminated)"""
+        current = self._current
+        current.clear()
+        current.update(psutil.pids())
+
+        terminated = []
+        gone = [pid for pid in self.known if pid not in current]
+        for pid in gone:
+            name = self.known.pop(pid)
+            if name is not None:
+                terminated.append((pid, name))
+        self.roblox_count -= len(terminated)
+
+        started = []
+        for pid in current:
+            if pid in self.known:
+                continue
+            try:
+                name = _roblox_name(pid, _listed_name(pid))
+            except (psutil.NoSuchProcess, FileNotFoundError, ProcessLookupError):
+                continue
+            except (psutil.AccessDenied, OSError):
+                name = None
+            self.known[pid] = name
+            if name is not None:
+                started.append((pid, name))
+        self.roblox_count += len(started)
+
+        return started, terminated
+
+    def forget_roblox(self):
+        """After a kill, stop tracking Roblox PIDs so their exit is not reported as a close"""
+        for pid, name in self.known.items():
+            if name is not None:
+                self.known[pid] = None
+        self.roblox_count = 0
 
 async def simple_polling_monitor():
     record = Record()
-    """Alternative monitoring method using simple polling"""
-    known_processes = set()
+    """Alternative monitoring method: WMI process events on Windows, PID polling elsewhere"""
+    tracker = _RobloxPidTracker()
 
     conf = load_config()
 
+    async def handle_started(pid, name):
+        """Returns True when the process was auto-closed"""
+        print(f"Process started: {name} (PID: {pid})")
+        # Check config and kill if auto_close_roblox is enabled
+        if conf.get("auto_close_roblox", False):
+            print(f"Auto-closing Roblox process: {name} (PID: {pid})")
+            await kill_roblox_processes()
+            tracker.forget_roblox()
+            return True
+        record.start()
+        send_mobile_alert(f"{name} has started (PID: {pid})")
+        return False
+
+    def handle_terminated(pid, name):
+        print(f"Process terminated: {name} (PID: {pid})")
+        send_mobile_alert(f"{name} has closed (PID: {pid})")
+        record.end()
+
     # Get initial state and handle already running processes
-    for proc in psutil.process_iter(['pid', 'name']):
-        try:
-            if proc.info['name'] in ROBLOX_PROCESSES or 'roblox' in proc.info['name'].lower():
-                known_processes.add((proc.info['pid'], proc.info['name']))
-                # If auto_close_roblox is enabled, kill already running processes
-                if conf.get("auto_close_roblox", False):
-                    print(f"Found existing Roblox process: {proc.info['name']} (PID: {proc.info['pid']}) - killing due to auto_close_roblox")
-                    await kill_roblox_processes()
-                    known_processes.clear()  # Clear since we killed all processes
-                    break  # Exit loop since we killed all processes
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+    existing, _ = tracker.diff()
+    if existing and conf.get("auto_close_roblox", False):
+        pid, name = existing[0]
+        print(f"Found existing Roblox process: {name} (PID: {pid}) - killing due to auto_close_roblox")
+        await kill_roblox_processes()
+        tracker.forget_roblox()
 
-    while True:
-        
-        current_processes = set()
+    async def handle_changes(started, terminated):
+        for pid, name in started:
+            if await handle_started(pid, name):
+                return  # every Roblox process was just killed
+        for pid, name in terminated:
+            handle_terminated(pid, name)
 
-        # Get current processes
-        for proc in psutil.process_iter(['pid', 'name']):
+    # Event-driven on Windows: WMI reports starts and exits, and a None on
+    # events means a watcher thread failed and polling takes over
+    events = asyncio.Queue()
+    watcher = WmiProcWatcher(
+        lambda pid, name: events.put_nowait(("creation", pid, name)),
+        lambda pid, name: events.put_nowait(("deletion", pid, name)),
+        lambda name: name in ROBLOX_PROCESSES,
+        on_error=lambda: events.put_nowait(None)
+    )
+    if watcher.start():
+        # WMI can miss events, so rescan the PID list when it stays quiet
+        rescan_interval = conf.get("event_rescan_interval", 30)
+        while True:
             try:
-                if proc.info['name'] in ROBLOX_PROCESSES:
-                    current_processes.add((proc.info['pid'], proc.info['name']))
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        # Check for new processes
-        new_processes = current_processes - known_processes
-        for pid, name in new_processes:
-            print(f"Process started: {name} (PID: {pid})")
-            # Check config and kill if auto_close_roblox is enabled
-            if conf.get("auto_close_roblox", False):
-                print(f"Auto-closing Roblox process: {name} (PID: {pid})")
-                await kill_roblox_processes()
-                current_processes.clear()  # Clear since we killed all processes
-            else:
-                record.start()
-                send_mobile_alert(f"{name} has started (PID: {pid})")
-
-        # Check for terminated processes
-        terminated_processes = known_processes - current_processes
-        for pid, name in terminated_processes:
-            print(f"Process terminated: {name} (PID: {pid})")
-            send_mobile_alert(f"{name} has closed (PID: {pid})")
-            record.end()
-
-        known_processes = current_processes
-        await asyncio.sleep(1)  # Poll every 5 seconds
+                event = await asyncio.wait_for(events.get(), rescan_interval)
+            except asyncio.TimeoutError:
+                await handle_changes(*tracker.diff())
+                continue
+            if event is None:
+                print("WMI process events stopped, falling back to polling")
+                watcher.close()
+                break
+            notification_type, pid, name = event
+            if notification_type == "creation":
+                if tracker.known.get(pid) is not None:
+                    continue  # already picked up by a rescan
+                tracker.known[pid] = name
+                tracker.roblox_count += 1
+                await handle_started(pid, name)
+            elif tracker.known.pop(pid, None) is not None:
+                tracker.roblox_count -= 1
+                handle_terminated(pid, name)
+
+    # While Roblox is absent and nothing changes, stretch the poll interval
+    # up to monitor_max_interval; any start or close snaps it back
+    base_interval = conf.get("monitor_interval", 2)
+    max_interval = max(conf.get("monitor_max_interval", MONITOR_MAX_INTERVAL), base_interval)
+    interval = base_interval
+    while True:
+        started, terminated = tracker.diff()
+        if started or terminated or tracker.roblox_count:
+            interval = base_interval
+        else:
+            interval = min(interval * 1.5, max_interval)
+
+        await handle_changes(started, terminated)
+
+        await asyncio.sleep(interval)
 
 def send_mobile_alert(message):
     print(f"🚨 ALERT TRIGGERED: {message}")
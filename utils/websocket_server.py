@@ -1,9 +1,9 @@
 import asyncio
 import websockets
-import json
 import logging
+import orjson
 from typing import Set, Dict, Any
-from datetime import datetime
+from utils.clock import now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -45,18 +45,18 @@ class WebSocketServer:
         
         try:
             # Send welcome message
-            await websocket.send(json.dumps({
+            await websocket.send(orjson.dumps({
                 "type": "welcome",
                 "message": "Connected to Roblox Monitor WebSocket",
-                "timestamp": datetime.now().isoformat()
-            }))
+                "timestamp": now_iso()
+            }).decode())
             
             # Handle incoming messages
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     await self.handle_message(websocket, data)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Invalid JSON received: {message}")
                     
         except websockets.exceptions.ConnectionClosed:
@@ -71,10 +71,10 @@ class WebSocketServer:
         message_type = data.get("type")
         
         if message_type == "ping":
-            await websocket.send(json.dumps({
+            await websocket.send(orjson.dumps({
                 "type": "pong", 
-                "timestamp": datetime.now().isoformat()
-            }))
+                "timestamp": now_iso()
+            }).decode())
         elif message_type == "desktop_ready":
             logger.info("Desktop client is ready to receive events")
         elif message_type == "command":
@@ -87,39 +87,51 @@ class WebSocketServer:
         logger.info(f"Received command from desktop client: {command}")
         # Commands will be processed by main application
     
-    async def broadcast_event(self, event_type: str, data: Dict[str, Any]):
-        """Broadcast event to all connected desktop clients"""
+    async def broadcast_event(self, event_type: str, data: Dict[str, Any]) -> int:
+        """Broadcast event to all connected desktop clients
+        
+        Returns how many clients the event was delivered to.
+        """
         if not self.connected_clients:
             logger.warning(f"No desktop clients connected to receive event: {event_type}")
-            return
+            return 0
         
-        message = {
-            "type": "event",
-            "event_type": event_type,
-            "data": data,
-            "timestamp": datetime.now().isoformat()
-        }
+        # Serialized once and sent as text to every client
+        message = self._build_event(event_type, data)
         
-        # Send to all connected clients
-        disconnected = set()
-        for client in self.connected_clients:
-            try:
-                await client.send(json.dumps(message))
-            except websockets.exceptions.ConnectionClosed:
-                disconnected.add(client)
-            except Exception as e:
-                logger.error(f"Error sending to client: {e}")
-                disconnected.add(client)
+        # Send to all connected clients at once so one slow client does not
+        # hold up the rest; snapshot the set since clients come and go meanwhile
+        clients = list(self.connected_clients)
+        results = await asyncio.gather(
+            *(client.send(message) for client in clients),
+            return_exceptions=True
+        )
         
         # Remove disconnected clients
-        for client in disconnected:
-            self.connected_clients.discard(client)
+        delivered = 0
+        for client, result in zip(clients, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, websockets.exceptions.ConnectionClosed):
+                    logger.error(f"Error sending to client: {result}")
+                self.connected_clients.discard(client)
+            else:
+                delivered += 1
         
-        logger.info(f"Broadcasted {event_type} to {len(self.connected_clients)} clients")
+        logger.info(f"Broadcasted {event_type} to {delivered} clients")
+        return delivered
+    
+    def _build_event(self, event_type: str, data: Dict[str, Any]) -> str:
+        """Serialize an event frame in the format broadcast_event sends"""
+        return orjson.dumps({
+            "type": "event",
+            "event_type": event_type,
+            "data": data,
+            "timestamp": now_iso()
+        }).decode()
     
-    async def send_to_desktop(self, message_type: str, data: Dict[str, Any]):
-        """Send specific message to desktop clients"""
-        await self.broadcast_event(message_type, data)
+    async def send_to_desktop(self, message_type: str, data: Dict[str, Any]) -> int:
+        """Send specific message to desktop clients, returning how many got it"""
+        return await self.broadcast_event(message_type, data)
     
     def has_connected_clients(self) -> bool:
         """Check if any desktop clients are connected"""